@@ -5,18 +5,25 @@ This is the main FastAPI application that imports all route modules.
 """
 
 import os
+import re
+import asyncio
 import logging
+from contextlib import asynccontextmanager
+from logging.handlers import QueueHandler, QueueListener
+from queue import SimpleQueue
 
-from fastapi import FastAPI, Request
+from fastapi import APIRouter, FastAPI, Request
 from fastapi.exceptions import RequestValidationError
-from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse, Response
 from starlette.exceptions import HTTPException
+from starlette.routing import Route
 
+import orjson
 from dotenv import load_dotenv
 
 from auth import JWT_SECRET
-from database import init_db
+from core.cache import flush_all_caches
+from database import engine, init_db, ping_db
 
 # Import route modules
 from routes.auth import router as auth_router
@@ -26,46 +33,21 @@ from routes.history import router as history_router
 from routes.profile import router as profile_router
 from routes.stats import router as stats_router
 
-# Configure logging
+# Configure logging: request-path log calls only enqueue records; the file and
+# console writes happen on the listener thread started in lifespan().
+_log_queue = SimpleQueue()
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.FileHandler("app.log"),
-        logging.StreamHandler()
-    ]
+    handlers=[QueueHandler(_log_queue)]
+)
+_log_listener = QueueListener(
+    _log_queue,
+    logging.FileHandler("app.log"),
+    logging.StreamHandler(),
 )
 logger = logging.getLogger(__name__)
 
-# Create FastAPI app
-app = FastAPI(title="Product Review Engine API")
-
-
-# =============================================================================
-# Error Handlers
-# =============================================================================
-
-def _error(message: str, status_code: int = 400):
-    return JSONResponse(status_code=status_code, content={"error": {"message": message}})
-
-
-@app.exception_handler(HTTPException)
-async def http_exception_handler(request: Request, exc: HTTPException):
-    detail = exc.detail
-    msg = detail if isinstance(detail, str) else str(detail)
-    return _error(msg, status_code=exc.status_code)
-
-
-@app.exception_handler(RequestValidationError)
-async def validation_exception_handler(request: Request, exc: RequestValidationError):
-    return _error("Invalid request.", status_code=422)
-
-
-@app.exception_handler(Exception)
-async def unhandled_exception_handler(request: Request, exc: Exception):
-    logger.exception("Unhandled error")
-    return _error("An unexpected error occurred while processing your request.", status_code=500)
-
 
 # =============================================================================
 # Load Environment
@@ -77,52 +59,176 @@ try:
 except Exception:
     pass
 
+IS_PRODUCTION = os.getenv("ENV", "").lower() in ("prod", "production")
+
 
 # =============================================================================
-# Startup Event
+# Lifespan
 # =============================================================================
 
-@app.on_event("startup")
-async def startup_event():
+async def _warm_db_pool() -> None:
+    """Open every pooled DB connection up front so early requests skip the handshake."""
+    pool_size = engine.pool.size() if hasattr(engine.pool, "size") else 1
+    await asyncio.gather(*(asyncio.to_thread(ping_db) for _ in range(pool_size)))
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run startup checks; the log listener lives as long as the app."""
+    _log_listener.start()
+    try:
+        await _startup()
+        yield
+    finally:
+        # Persist pending cache writes before the worker goes away
+        await asyncio.to_thread(flush_all_caches)
+        _log_listener.stop()
+
+
+async def _startup() -> None:
     """Initialize application on startup"""
-    logger.info("=" * 60)
-    logger.info("🚀 Product Review Engine API Starting...")
-    logger.info("=" * 60)
+    rule = "=" * 60
+    # Status lines are collected and emitted as one banner record at the end
+    banner = [rule, "🚀 Product Review Engine API Starting...", rule]
     
     # Initialize database
     try:
-        init_db()
-        logger.info("✓ Database initialized successfully")
+        await asyncio.to_thread(init_db)
+        banner.append("✓ Database initialized successfully")
     except Exception as e:
         logger.error(f"✗ Database initialization failed: {e}")
         raise
+
+    try:
+        await _warm_db_pool()
+        banner.append("✓ Database connection pool warmed")
+    except Exception as e:
+        logger.warning(f"⚠ Database pool warm-up failed: {e}")
     
     # Check for required environment variables
     groq_key = os.getenv("GROQ_API_KEY")
     if groq_key:
-        logger.info("✓ GROQ_API_KEY found")
+        banner.append("✓ GROQ_API_KEY found")
     else:
         logger.warning("⚠ GROQ_API_KEY not set - API will fail on review requests")
 
     # Security check
-    env = os.getenv("ENV", "").lower()
-    if env in ("prod", "production") and JWT_SECRET == "dev-insecure-change-me":
+    if IS_PRODUCTION and JWT_SECRET == "dev-insecure-change-me":
         raise RuntimeError("JWT_SECRET is using the insecure default; set JWT_SECRET in production")
     
     db_url = os.getenv("DATABASE_URL", "sqlite:///./app.db")
-    logger.info(f"✓ Database: {db_url}")
-    
-    logger.info("✓ CORS enabled for development and production origins")
-    logger.info("=" * 60)
-    logger.info("✅ API ready! Listening for requests...")
-    logger.info("=" * 60)
+    banner += [
+        f"✓ Database: {db_url}",
+        "✓ CORS enabled for development and production origins",
+        rule,
+        "✅ API ready! Listening for requests...",
+        rule,
+    ]
+    logger.info("\n".join(banner))
+
+
+# Create FastAPI app
+app = FastAPI(
+    title="Product Review Engine API",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+    # Skip OpenAPI schema generation (and /docs) in production
+    openapi_url=None if IS_PRODUCTION else "/openapi.json",
+)
+
+
+# =============================================================================
+# Error Handlers
+# =============================================================================
+
+def _error_body(message: str) -> bytes:
+    return orjson.dumps({"error": {"message": message}})
+
+
+# Constant error payloads are serialized once at import.
+_VALIDATION_BODY = _error_body("Invalid request.")
+_UNEXPECTED_BODY = _error_body("An unexpected error occurred while processing your request.")
+
+
+def _error(message: str, status_code: int = 400):
+    return Response(content=_error_body(message), status_code=status_code, media_type="application/json")
+
+
+@app.exception_handler(HTTPException)
+async def http_exception_handler(request: Request, exc: HTTPException):
+    detail = exc.detail
+    msg = detail if isinstance(detail, str) else str(detail)
+    return _error(msg, status_code=exc.status_code)
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+    return Response(content=_VALIDATION_BODY, status_code=422, media_type="application/json")
+
+
+@app.exception_handler(Exception)
+async def unhandled_exception_handler(request: Request, exc: Exception):
+    logger.exception("Unhandled error")
+    return Response(content=_UNEXPECTED_BODY, status_code=500, media_type="application/json")
+
+
+class ErrorCatchMiddleware:
+    """Pure-ASGI error handling for exceptions that escape the router.
+
+    Sends the same JSON error bodies as the handlers above directly through
+    ``send``. Exceptions raised after the response has started are re-raised
+    untouched. The handlers above stay registered for route-level errors.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        response_started = False
+
+        async def send_wrapper(message):
+            nonlocal response_started
+            if message["type"] == "http.response.start":
+                response_started = True
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        except Exception as exc:
+            if response_started:
+                raise
+            if isinstance(exc, HTTPException):
+                detail = exc.detail
+                body = _error_body(detail if isinstance(detail, str) else str(detail))
+                status_code = exc.status_code
+            elif isinstance(exc, RequestValidationError):
+                body, status_code = _VALIDATION_BODY, 422
+            else:
+                logger.exception("Unhandled error")
+                body, status_code = _UNEXPECTED_BODY, 500
+            await send({
+                "type": "http.response.start",
+                "status": status_code,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(body)).encode("latin-1")),
+                ],
+            })
+            await send({"type": "http.response.body", "body": body})
+
+
+app.add_middleware(ErrorCatchMiddleware)
 
 
 # =============================================================================
 # CORS Configuration
 # =============================================================================
 
-FRONTEND_ORIGINS = [
+FRONTEND_ORIGINS = frozenset({
     "http://localhost:5173",
     "http://127.0.0.1:5173",
     "http://localhost:5174",
@@ -131,17 +237,107 @@ FRONTEND_ORIGINS = [
     "http://127.0.0.1:5175",
     "http://localhost:5176",
     "http://127.0.0.1:5176",
-]
+})
+
+# Single-label *.vercel.app hosts only; no wildcard, so matching is linear
+VERCEL_ORIGIN_REGEX = re.compile(r"https://[a-zA-Z0-9-]+\.vercel\.app", re.ASCII)
+
+
+class FastCORSMiddleware:
+    """Pure-ASGI CORS middleware.
+
+    Equivalent to Starlette's CORSMiddleware configured with
+    ``allow_methods=["*"]`` and ``allow_headers=["*"]``, but every header value
+    that does not depend on the request is precomputed as bytes up front, and
+    requests without an ``Origin`` header are passed straight through.
+    """
+
+    ALLOW_METHODS = b"DELETE, GET, HEAD, OPTIONS, PATCH, POST, PUT"
+    MAX_AGE = b"600"
+
+    def __init__(self, app, allow_origins=(), allow_origin_regex=None, allow_credentials=False):
+        self.app = app
+        self._allow_origins = frozenset(allow_origins)
+        # Accepts either a pattern string or a precompiled pattern
+        self._regex = re.compile(allow_origin_regex) if allow_origin_regex else None
+        self._allow_credentials = allow_credentials
+
+    def _is_allowed(self, origin: str) -> bool:
+        if origin in self._allow_origins:
+            return True
+        return self._regex is not None and self._regex.fullmatch(origin) is not None
+
+    def _origin_headers(self, origin: bytes) -> list:
+        headers = [(b"access-control-allow-origin", origin), (b"vary", b"Origin")]
+        if self._allow_credentials:
+            headers.append((b"access-control-allow-credentials", b"true"))
+        return headers
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = None
+        request_method = None
+        request_headers = b""
+        for name, value in scope["headers"]:
+            if name == b"origin":
+                origin = value
+            elif name == b"access-control-request-method":
+                request_method = value
+            elif name == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None:
+            await self.app(scope, receive, send)
+            return
+
+        allowed = self._is_allowed(origin.decode("latin-1"))
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            await self._preflight(send, origin if allowed else None, request_headers)
+            return
+
+        if not allowed:
+            await self.app(scope, receive, send)
+            return
+
+        extra_headers = self._origin_headers(origin)
+
+        async def send_with_cors(message):
+            if message["type"] == "http.response.start":
+                # Copy rather than mutate: endpoints may reuse prebuilt messages.
+                message = {**message, "headers": list(message.get("headers", ())) + extra_headers}
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
+
+    async def _preflight(self, send, origin, request_headers: bytes) -> None:
+        if origin is None:
+            status, body = 400, b"Disallowed CORS origin"
+            headers = []
+        else:
+            status, body = 200, b"OK"
+            headers = self._origin_headers(origin) + [
+                (b"access-control-allow-methods", self.ALLOW_METHODS),
+                (b"access-control-max-age", self.MAX_AGE),
+            ]
+            if request_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+        headers += [
+            (b"content-type", b"text/plain; charset=utf-8"),
+            (b"content-length", str(len(body)).encode("latin-1")),
+        ]
+        await send({"type": "http.response.start", "status": status, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
 
-VERCEL_ORIGIN_REGEX = r"https://.*\.vercel\.app"
 
 app.add_middleware(
-    CORSMiddleware,
+    FastCORSMiddleware,
     allow_origins=FRONTEND_ORIGINS,
     allow_origin_regex=VERCEL_ORIGIN_REGEX,
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
 )
 
 
@@ -149,32 +345,71 @@ app.add_middleware(
 # Health Check
 # =============================================================================
 
-@app.get("/health")
-async def health_check():
-    return {"status": "ok"}
+_HEALTH_BODY = b'{"status":"ok"}'
+_HEALTH_START = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": [
+        (b"content-type", b"application/json"),
+        (b"content-length", str(len(_HEALTH_BODY)).encode("latin-1")),
+    ],
+}
+_HEALTH_MESSAGE = {"type": "http.response.body", "body": _HEALTH_BODY}
+
+
+class HealthCheck:
+    """Raw ASGI endpoint for /health.
+
+    Probes hit this continuously, so it skips FastAPI's dependency solving and
+    JSON encoding and sends a pre-serialized response. (Starlette only treats
+    non-function endpoints as raw ASGI apps, hence the class.)
+    """
+
+    async def __call__(self, scope, receive, send):
+        await send(_HEALTH_START)
+        await send(_HEALTH_MESSAGE)
+
+
+app.router.routes.append(
+    Route("/health", HealthCheck(), methods=["GET"], include_in_schema=False)
+)
 
 
 # =============================================================================
 # Admin Cache Management
 # =============================================================================
 
-@app.post("/api/admin/clear-cache")
-async def clear_cache():
-    """Clear all cached data (images, content, search results)."""
-    import shutil
-    from pathlib import Path
-    
-    cache_dir = Path(".cache")
+CACHE_DIR = ".cache"
+
+
+def _clear_cache_sync() -> int:
+    """Delete cache entries from disk and return how many were removed."""
     cleared_count = 0
     
-    if cache_dir.exists():
-        for cache_file in cache_dir.glob("*.json"):
+    # scandir yields entries with their file type, so there is no extra stat() per file
+    try:
+        entries = os.scandir(CACHE_DIR)
+    except FileNotFoundError:
+        return 0
+    
+    with entries:
+        for entry in entries:
+            if not entry.name.endswith(".json") or not entry.is_file():
+                continue
             try:
-                cache_file.unlink()
+                os.unlink(entry.path)
                 cleared_count += 1
             except Exception:
                 pass
     
+    return cleared_count
+
+
+@app.post("/api/admin/clear-cache")
+async def clear_cache():
+    """Clear all cached data (images, content, search results)."""
+    # Directory scans and unlinks block; keep them off the event loop.
+    cleared_count = await asyncio.to_thread(_clear_cache_sync)
     logger.info(f"Cache cleared: {cleared_count} entries removed")
     return {"status": "ok", "message": f"Cleared {cleared_count} cache entries"}
 
@@ -183,9 +418,31 @@ async def clear_cache():
 # Include Route Modules
 # =============================================================================
 
-app.include_router(auth_router)
-app.include_router(review_router)
-app.include_router(chat_router)
-app.include_router(history_router)
-app.include_router(profile_router)
-app.include_router(stats_router)
+api_router = APIRouter()
+for _router in (auth_router, review_router, chat_router, history_router, profile_router, stats_router):
+    api_router.include_router(_router)
+
+app.include_router(api_router)
+
+
+# =============================================================================
+# Entrypoint
+# =============================================================================
+
+if __name__ == "__main__":
+    import sys
+
+    import uvicorn
+
+    # uvloop (libuv event loop) and httptools (C HTTP parser) ship with
+    # uvicorn[standard]; uvloop is not available on Windows.
+    uvicorn.run(
+        "api:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8001")),
+        loop="asyncio" if sys.platform == "win32" else "uvloop",
+        http="httptools",
+        workers=int(os.getenv("WORKERS", "1")),
+        limit_concurrency=int(os.getenv("LIMIT_CONCURRENCY", "1000")),
+        backlog=2048,
+    )
@@ -1,25 +1,43 @@
 from __future__ import annotations
 
 import os
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Optional
+from functools import lru_cache
+from typing import Dict, Optional, Tuple
 
+import bcrypt
+import jwt
 from fastapi import Depends, HTTPException
 from fastapi.security import OAuth2PasswordBearer
-from jose import JWTError, jwt
-from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, make_transient_to_detached
 
 from database import get_db
 from db_models import User
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# bcrypt cost factor; tune per environment (each +1 doubles hashing time)
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
 
 # Token settings
 JWT_SECRET = os.getenv("JWT_SECRET", "dev-insecure-change-me")
 JWT_ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 JWT_EXPIRES_MINUTES = int(os.getenv("JWT_EXPIRES_MINUTES", "10080"))  # 7 days
 
+# Built once; reused on every token encode/decode.
+_JWT_ALGS = [JWT_ALGORITHM]
+_JWT_KEY = JWT_SECRET.encode("utf-8")
+_JWT_EXPIRES_DELTA = timedelta(minutes=JWT_EXPIRES_MINUTES)
+
+# Short-lived cache of authenticated users keyed by id, so repeat requests
+# carrying the same token skip the users-table lookup. Call invalidate_user()
+# after changing or deleting a user row.
+USER_CACHE_TTL_SECONDS = int(os.getenv("USER_CACHE_TTL_SECONDS", "60"))
+USER_CACHE_MAX_SIZE = 10_000
+_user_cache: Dict[int, Tuple[float, User]] = {}
+# Dependencies run on FastAPI's threadpool; guards every _user_cache access
+_user_cache_lock = threading.Lock()
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 # Optional variant (endpoints can accept missing token)
 oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
@@ -27,34 +45,86 @@ oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_e
 
 def hash_password(password: str) -> str:
     # Bcrypt has a 72 byte limit. Truncate to ensure safety.
-    return pwd_context.hash(password[:72])
+    hashed = bcrypt.hashpw(password.encode("utf-8")[:72], bcrypt.gensalt(rounds=BCRYPT_ROUNDS))
+    return hashed.decode("utf-8")
 
 
 def verify_password(password: str, password_hash: str) -> bool:
-    return pwd_context.verify(password[:72], password_hash)
+    try:
+        return bcrypt.checkpw(password.encode("utf-8")[:72], password_hash.encode("utf-8"))
+    except ValueError:
+        # Malformed or non-bcrypt hash
+        return False
 
 
 def create_access_token(*, user_id: int) -> str:
-    expires_delta = timedelta(minutes=JWT_EXPIRES_MINUTES)
-    expire = datetime.now(timezone.utc) + expires_delta
+    expire = datetime.now(timezone.utc) + _JWT_EXPIRES_DELTA
     payload = {"sub": str(user_id), "exp": expire}
-    return jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
+    return jwt.encode(payload, _JWT_KEY, algorithm=JWT_ALGORITHM)
+
+
+@lru_cache(maxsize=8192)
+def _decode_cached(token: str) -> Tuple[int, Optional[int]]:
+    """Verify a token once and remember its (user_id, exp).
+
+    Failures raise and are therefore never cached; expiry is re-checked by
+    the caller on every use.
+    """
+    payload = jwt.decode(token, _JWT_KEY, algorithms=_JWT_ALGS)
+    sub = payload.get("sub")
+    if not sub:
+        raise ValueError("Token has no subject")
+    exp = payload.get("exp")
+    return int(sub), int(exp) if exp is not None else None
 
 
 def decode_token(token: str) -> int:
     try:
-        payload = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
-        sub = payload.get("sub")
-        if not sub:
-            raise HTTPException(status_code=401, detail="Invalid token")
-        return int(sub)
-    except (JWTError, ValueError):
+        user_id, exp = _decode_cached(token)
+    except (jwt.InvalidTokenError, ValueError):
         raise HTTPException(status_code=401, detail="Invalid token")
+    if exp is not None and exp <= time.time():
+        raise HTTPException(status_code=401, detail="Invalid token")
+    return user_id
+
+
+def invalidate_user(user_id: int) -> None:
+    """Drop a user's cached row; call after updating or deleting the user."""
+    with _user_cache_lock:
+        _user_cache.pop(user_id, None)
+
+
+def _load_user(db: Session, user_id: int) -> Optional[User]:
+    now = time.monotonic()
+    with _user_cache_lock:
+        cached = _user_cache.get(user_id)
+    if cached is not None and cached[0] > now:
+        # Attach a copy of the cached row to this session without emitting SQL
+        return db.merge(cached[1], load=False)
+
+    user = db.get(User, user_id)
+    if user is None:
+        invalidate_user(user_id)
+        return None
+
+    # Cache a detached snapshot; the loaded instance stays owned by this session
+    snapshot = User(
+        id=user.id,
+        external_id=user.external_id,
+        password_hash=user.password_hash,
+        created_at=user.created_at,
+    )
+    make_transient_to_detached(snapshot)
+    with _user_cache_lock:
+        if user_id not in _user_cache and len(_user_cache) >= USER_CACHE_MAX_SIZE:
+            _user_cache.pop(next(iter(_user_cache)), None)
+        _user_cache[user_id] = (now + USER_CACHE_TTL_SECONDS, snapshot)
+    return user
 
 
 def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)) -> User:
     user_id = decode_token(token)
-    user = db.query(User).filter(User.id == user_id).first()
+    user = _load_user(db, user_id)
     if not user:
         raise HTTPException(status_code=401, detail="User not found")
     return user
@@ -67,4 +137,4 @@ def get_current_user_optional(
     if not token:
         return None
     user_id = decode_token(token)
-    return db.query(User).filter(User.id == user_id).first()
+    return _load_user(db, user_id)
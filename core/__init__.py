@@ -2,30 +2,64 @@
 Core package for Product Review Engine.
 
 This package contains the modularized components extracted from app_update.py.
+
+Names re-exported here (``from core import AppConfig`` etc.) are imported on
+first access rather than when the package loads, so the pydantic models in
+core.models are only built once something actually uses them.
 """
 
-from core.config import AppConfig, Constants
-from core.currency import CurrencyFormatter
-from core.models import (
-    SearchResult,
-    ScrapedContent,
-    ProductReview,
-    SentimentScore,
-    ProductImage,
-    RetailerPrice,
-    PriceComparison,
-    RedFlag,
-    RedFlagReport,
-    PurchaseTimingAdvice,
-    BestForTag,
-    UserProfile,
-    ProductComparisonItem,
-    ProductComparison,
-    AlternativeProduct,
-    RecommendedRetailer,
-    ResaleAnalysis,
-    EnhancedProductReview,
-)
+import importlib
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from core.config import AppConfig, Constants
+    from core.currency import CurrencyFormatter
+    from core.models import (
+        SearchResult,
+        ScrapedContent,
+        ProductReview,
+        SentimentScore,
+        ProductImage,
+        RetailerPrice,
+        PriceComparison,
+        RedFlag,
+        RedFlagReport,
+        PurchaseTimingAdvice,
+        BestForTag,
+        UserProfile,
+        ProductComparisonItem,
+        ProductComparison,
+        AlternativeProduct,
+        RecommendedRetailer,
+        ResaleAnalysis,
+        EnhancedProductReview,
+    )
+
+# Public names are resolved lazily (PEP 562): importing a submodule such as
+# core.cache no longer drags in every other submodule via this package init.
+_name_to_module = {
+    'AppConfig': 'core.config',
+    'Constants': 'core.config',
+    'CurrencyFormatter': 'core.currency',
+    'SearchResult': 'core.models',
+    'ScrapedContent': 'core.models',
+    'ProductReview': 'core.models',
+    'SentimentScore': 'core.models',
+    'ProductImage': 'core.models',
+    'RetailerPrice': 'core.models',
+    'PriceComparison': 'core.models',
+    'RedFlag': 'core.models',
+    'RedFlagReport': 'core.models',
+    'PurchaseTimingAdvice': 'core.models',
+    'BestForTag': 'core.models',
+    'UserProfile': 'core.models',
+    'ProductComparisonItem': 'core.models',
+    'ProductComparison': 'core.models',
+    'AlternativeProduct': 'core.models',
+    'RecommendedRetailer': 'core.models',
+    'ResaleAnalysis': 'core.models',
+    'EnhancedProductReview': 'core.models',
+}
 
 __all__ = [
     'AppConfig',
@@ -50,3 +84,16 @@ __all__ = [
     'ResaleAnalysis',
     'EnhancedProductReview',
 ]
+
+
+def __getattr__(name):
+    mod_name = _name_to_module.get(name)
+    if mod_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(mod_name), name)
+    globals()[name] = value  # cache so later lookups bypass __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -2,13 +2,25 @@
 AI-powered analysis modules for product reviews.
 """
 
-import json
+import hashlib
+import importlib.util
 import logging
-from typing import List, Optional, Dict, Any, Tuple
+import re
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import List, Optional, Dict, Any, Tuple, Callable, Iterable
 from datetime import datetime, timezone
-from urllib.parse import quote_plus
+from urllib.parse import quote_from_bytes
+
+import httpx
+import orjson
 from groq import Groq
 
+from core.cache import CacheManager
 from core.config import AppConfig
 from core.models import (
     RedFlagReport, RedFlag, PurchaseTimingAdvice, ResaleAnalysis, 
@@ -20,6 +32,158 @@ from core.models import (
 logger = logging.getLogger(__name__)
 
 
+# HTTP/2 lets concurrent analyzer calls multiplex over one connection; it
+# needs the optional h2 package (httpx[http2]).
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+_shared_clients: Dict[str, Groq] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def get_shared_groq_client(api_key: str) -> Groq:
+    """Return the process-wide Groq client for ``api_key``.
+
+    Every service and analyzer built from the same key shares one client and
+    therefore one HTTPX connection pool, so requests reuse warm TLS
+    connections instead of handshaking for each new service.
+    """
+    with _shared_clients_lock:
+        client = _shared_clients.get(api_key)
+        if client is None:
+            client = Groq(
+                api_key=api_key,
+                http_client=httpx.Client(
+                    http2=_HTTP2_AVAILABLE,
+                    limits=httpx.Limits(max_connections=32, max_keepalive_connections=16)
+                )
+            )
+            _shared_clients[api_key] = client
+        return client
+
+# Longest head of the scraped text any analyzer prompt reads
+MAX_CONTEXT_CHARS = 3000
+
+
+def build_analysis_context(contents: Iterable[str], limit: int = MAX_CONTEXT_CHARS) -> str:
+    """Join scraped page texts with spaces, stopping once ``limit`` characters are collected.
+
+    Equivalent to ``" ".join(contents)[:limit]`` without concatenating every
+    page in full first. Pass the result to every analyzer that takes
+    ``scraped_text`` so they share one string.
+    """
+    parts = []
+    total = 0
+    for text in contents:
+        if not text:
+            continue
+        parts.append(text)
+        total += len(text) + 1
+        if total > limit:
+            break
+    return " ".join(parts)[:limit]
+
+def run_all_analyzers(jobs: Dict[str, Callable[[], Any]], max_workers: int = 8) -> Dict[str, Any]:
+    """Run independent analyzer calls concurrently.
+
+    Each analyzer spends almost all of its time waiting on a Groq round-trip,
+    so fanning them out over a thread pool brings total latency down to the
+    slowest single call. ``jobs`` maps a label to a zero-argument callable;
+    a job that raises is logged under its label and yields None.
+    """
+    if not jobs:
+        return {}
+
+    results: Dict[str, Any] = {}
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        futures = {label: executor.submit(job) for label, job in jobs.items()}
+        for label, future in futures.items():
+            try:
+                results[label] = future.result()
+            except Exception as e:
+                logger.warning(f"{label} failed: {e}")
+                results[label] = None
+    return results
+
+
+# Red flag keyword tables. The matching patterns are compiled once at import
+# rather than per detector, since a detector is built for every service.
+DEFECT_KEYWORDS = [
+    'defective', 'broken', 'stopped working', 'died', 'malfunction',
+    'not working', 'faulty', 'dead on arrival', 'DOA', 'repair',
+    'replacement', 'warranty claim', 'returned'
+]
+
+RELIABILITY_KEYWORDS = [
+    'unreliable', 'inconsistent', 'random', 'crashes', 'freezes',
+    'overheating', 'battery drain', 'slow', 'lag', 'buggy'
+]
+
+FAKE_REVIEW_INDICATORS = [
+    'received free', 'in exchange for', 'honest review', 'disclaimer',
+    'provided by', 'gifted', 'sponsored'
+]
+
+SEVERE_CON_WORDS = ['major', 'serious', 'critical', 'deal-breaker', 'avoid']
+
+_KEYWORD_CATEGORIES: Dict[str, str] = {
+    keyword.lower(): category
+    for category, keywords in (('defect', DEFECT_KEYWORDS),
+                               ('reliability', RELIABILITY_KEYWORDS),
+                               ('fake', FAKE_REVIEW_INDICATORS))
+    for keyword in keywords
+}
+
+# Acronyms such as 'DOA' only count as whole words, so "doable" stays clean.
+_WHOLE_WORD_KEYWORDS = frozenset(
+    keyword.lower()
+    for keywords in (DEFECT_KEYWORDS, RELIABILITY_KEYWORDS, FAKE_REVIEW_INDICATORS)
+    for keyword in keywords
+    if keyword.isupper()
+)
+
+
+def _keyword_pattern(keyword: str) -> str:
+    pattern = re.escape(keyword)
+    if keyword in _WHOLE_WORD_KEYWORDS:
+        pattern = r"\b{}\b".format(pattern)
+    return pattern
+
+
+# One pattern tags every keyword from every category in a single pass. The
+# lookahead lets matches overlap, so each keyword is found exactly as a plain
+# substring test would find it (or as a whole word, for acronyms).
+_KEYWORD_RE = re.compile("(?=({}))".format(
+    "|".join(_keyword_pattern(keyword) for keyword in sorted(_KEYWORD_CATEGORIES, key=len, reverse=True))
+))
+_SEVERE_CON_RE = re.compile("|".join(map(re.escape, SEVERE_CON_WORDS)))
+
+
+def _score_red_flags(defect_count: int, reliability_count: int,
+                     fake_count: int, severe_cons_count: int) -> Tuple[float, float, str]:
+    """Turn keyword tallies into (risk_score, fake_review_score, overall_risk).
+
+    Kept free of models and text so it can be reused when scoring many
+    reviews at once.
+    """
+    risk_score = 0.0
+    if defect_count >= 3:
+        risk_score += 3.0
+    elif defect_count >= 1:
+        risk_score += 1.5
+    if reliability_count >= 2:
+        risk_score += 2.0
+    if severe_cons_count:
+        risk_score += 1.5
+    
+    # Determine overall risk level
+    if risk_score >= 5:
+        overall_risk = "high"
+    elif risk_score >= 2:
+        overall_risk = "medium"
+    else:
+        overall_risk = "low"
+    
+    return min(risk_score, 10.0), min(fake_count * 0.15, 0.5), overall_risk
+
 class RedFlagDetector:
     """Detects potential issues and red flags in product reviews"""
     
@@ -28,32 +192,26 @@ class RedFlagDetector:
         self.config = config
         
         # Common red flag patterns
-        self.defect_keywords = [
-            'defective', 'broken', 'stopped working', 'died', 'malfunction',
-            'not working', 'faulty', 'dead on arrival', 'DOA', 'repair',
-            'replacement', 'warranty claim', 'returned'
-        ]
-        
-        self.reliability_keywords = [
-            'unreliable', 'inconsistent', 'random', 'crashes', 'freezes',
-            'overheating', 'battery drain', 'slow', 'lag', 'buggy'
-        ]
-        
-        self.fake_review_indicators = [
-            'received free', 'in exchange for', 'honest review', 'disclaimer',
-            'provided by', 'gifted', 'sponsored'
-        ]
+        self.defect_keywords = DEFECT_KEYWORDS
+        self.reliability_keywords = RELIABILITY_KEYWORDS
+        self.fake_review_indicators = FAKE_REVIEW_INDICATORS
     
     def analyze_red_flags(self, product_name: str, review_content: str, 
                          pros: List[str], cons: List[str]) -> RedFlagReport:
         """Analyze content for potential red flags"""
         red_flags = []
-        risk_score = 0.0
         
-        full_text = f"{review_content} {' '.join(cons)}".lower()
+        cons_lower = [con.lower() for con in cons]
+        full_text = f"{review_content.lower()} {' '.join(cons_lower)}"
+        
+        # Count distinct keywords per category
+        found = {match.group(1) for match in _KEYWORD_RE.finditer(full_text)}
+        category_counts = Counter(_KEYWORD_CATEGORIES[keyword] for keyword in found)
+        defect_count = category_counts['defect']
+        reliability_count = category_counts['reliability']
+        fake_count = category_counts['fake']
         
         # Check for defect patterns
-        defect_count = sum(1 for keyword in self.defect_keywords if keyword in full_text)
         if defect_count >= 3:
             red_flags.append(RedFlag(
                 severity="high",
@@ -62,7 +220,6 @@ class RedFlagDetector:
                 description=f"Found {defect_count} references to defects or malfunctions in reviews.",
                 affected_percentage=min(defect_count * 10, 50)
             ))
-            risk_score += 3.0
         elif defect_count >= 1:
             red_flags.append(RedFlag(
                 severity="medium",
@@ -71,10 +228,8 @@ class RedFlagDetector:
                 description="Some users reported defects or issues.",
                 affected_percentage=defect_count * 5
             ))
-            risk_score += 1.5
         
         # Check for reliability issues
-        reliability_count = sum(1 for keyword in self.reliability_keywords if keyword in full_text)
         if reliability_count >= 2:
             red_flags.append(RedFlag(
                 severity="medium",
@@ -82,11 +237,9 @@ class RedFlagDetector:
                 title="Reliability Concerns",
                 description="Multiple mentions of reliability or performance issues."
             ))
-            risk_score += 2.0
         
         # Analyze cons severity
-        severe_cons = [con for con in cons if any(word in con.lower() for word in 
-                      ['major', 'serious', 'critical', 'deal-breaker', 'avoid'])]
+        severe_cons = [con for con, con_lower in zip(cons, cons_lower) if _SEVERE_CON_RE.search(con_lower)]
         if severe_cons:
             red_flags.append(RedFlag(
                 severity="medium",
@@ -94,11 +247,8 @@ class RedFlagDetector:
                 title="Serious Drawbacks Noted",
                 description=f"Reviewers identified {len(severe_cons)} significant concerns."
             ))
-            risk_score += 1.5
         
         # Check for fake review indicators
-        fake_count = sum(1 for indicator in self.fake_review_indicators if indicator in full_text)
-        fake_review_score = min(fake_count * 0.15, 0.5)
         if fake_count >= 2:
             red_flags.append(RedFlag(
                 severity="low",
@@ -110,13 +260,9 @@ class RedFlagDetector:
         # Extract common complaints from cons
         common_complaints = cons[:5] if cons else []
         
-        # Determine overall risk level
-        if risk_score >= 5:
-            overall_risk = "high"
-        elif risk_score >= 2:
-            overall_risk = "medium"
-        else:
-            overall_risk = "low"
+        risk_score, fake_review_score, overall_risk = _score_red_flags(
+            defect_count, reliability_count, fake_count, len(severe_cons)
+        )
         
         # Generate recommendation
         if overall_risk == "high":
@@ -130,17 +276,161 @@ class RedFlagDetector:
             product_name=product_name,
             red_flags=red_flags,
             overall_risk_level=overall_risk,
-            risk_score=min(risk_score, 10.0),
+            risk_score=risk_score,
             fake_review_score=fake_review_score,
             common_complaints=common_complaints,
             recommendation=recommendation
         )
     
-    @property
-    def has_critical_issues(self) -> bool:
-        """Helper to unify 'critical' check if needed (not part of model, but logic)"""
-        # This logic is usually outside, but good to know: high risk = critical
-        return False # Placeholder if needed
+    def analyze_red_flags_batch(self, product_name: str, reviews: List[str],
+                                pros: List[str], cons_list: List[List[str]]) -> List[RedFlagReport]:
+        """Analyze many reviews of one product, returning one report per review.
+
+        ``reviews`` and ``cons_list`` are parallel; the keyword patterns are
+        compiled once at import, so each review costs one regex pass.
+        """
+        analyze = self.analyze_red_flags
+        return [analyze(product_name, review, pros, cons) for review, cons in zip(reviews, cons_list)]
+
+
+# Nigerian sale periods
+SALE_PERIODS = {
+    'black_friday': {'months': [11], 'name': 'Black Friday (November)'},
+    'boxing_day': {'months': [12], 'name': 'Boxing Day Sales (December)'},
+    'new_year': {'months': [1], 'name': 'New Year Sales (January)'},
+    'independence': {'months': [10], 'name': 'Independence Day Sales (October)'},
+    'easter': {'months': [3, 4], 'name': 'Easter Sales (March/April)'},
+    'back_to_school': {'months': [8, 9], 'name': 'Back to School (August/September)'}
+}
+
+# Product release patterns (approximate)
+RELEASE_PATTERNS = {
+    'iphone': {'typical_month': 9, 'cycle_years': 1},
+    'samsung galaxy': {'typical_month': 2, 'cycle_years': 1},
+    'pixel': {'typical_month': 10, 'cycle_years': 1},
+    'macbook': {'typical_month': 6, 'cycle_years': 1.5},
+    'ipad': {'typical_month': 3, 'cycle_years': 1.5},
+    'playstation': {'typical_month': 11, 'cycle_years': 7},
+    'xbox': {'typical_month': 11, 'cycle_years': 7},
+}
+
+
+def _sales_within(current_month: int) -> Tuple[str, ...]:
+    """Sale periods falling in the four months from current_month"""
+    months_to_check = [(current_month + i - 1) % 12 + 1 for i in range(4)]
+    upcoming = [
+        period_info['name'] for period_info in SALE_PERIODS.values()
+        if any(month in period_info['months'] for month in months_to_check)
+    ]
+    return tuple(upcoming[:3])
+
+
+# Flat lookup tables derived from the dicts above: upcoming sales per calendar
+# month, and release types/months as parallel tuples scanned by one pattern.
+_UPCOMING_SALES_BY_MONTH = tuple(_sales_within(month) for month in range(1, 13))
+_RELEASE_TYPES = tuple(RELEASE_PATTERNS)
+_RELEASE_MONTHS = tuple(pattern['typical_month'] for pattern in RELEASE_PATTERNS.values())
+_RELEASE_RE = re.compile("(?=({}))".format("|".join(map(re.escape, _RELEASE_TYPES))))
+
+_YEAR_RE = re.compile(r'(?<!\d)(20\d{2})(?!\d)')
+_NEW_HINT_RE = re.compile('latest|new|2024|2025')
+_OLD_HINT_RE = re.compile('previous|last gen|older')
+
+
+def _determine_lifecycle(product_lower: str, current_year: int) -> str:
+    """Determine product lifecycle stage"""
+    # Most recent release year from the last five years named in the product
+    years = [
+        year for year in map(int, _YEAR_RE.findall(product_lower))
+        if current_year - 5 < year <= current_year
+    ]
+    if years:
+        age = current_year - max(years)
+        if age == 0:
+            return "new"
+        elif age == 1:
+            return "mature"
+        return "end_of_life"
+    
+    if _NEW_HINT_RE.search(product_lower):
+        return "new"
+    elif _OLD_HINT_RE.search(product_lower):
+        return "end_of_life"
+    
+    return "mature"
+
+
+def _get_upcoming_sales(current_month: int) -> List[str]:
+    """Get upcoming sale periods"""
+    return list(_UPCOMING_SALES_BY_MONTH[current_month - 1])
+
+
+def _check_new_model(product_lower: str, current_month: int, current_year: int) -> Tuple[bool, Optional[str]]:
+    """Check if new model might be coming"""
+    matched = {match.group(1) for match in _RELEASE_RE.finditer(product_lower)}
+    if not matched:
+        return False, None
+    
+    for product_type, typical_month in zip(_RELEASE_TYPES, _RELEASE_MONTHS):
+        if product_type in matched:
+            months_until_release = (typical_month - current_month) % 12
+            if months_until_release <= 3:
+                quarter = (typical_month - 1) // 3 + 1
+                return True, f"Q{quarter} {current_year}"
+    
+    return False, None
+
+
+def _generate_recommendation(lifecycle: str, new_model: bool, 
+                             current_month: int, upcoming_sales: List[str]) -> Tuple[str, str]:
+    """Generate purchase recommendation"""
+    in_sale_period = current_month in [11, 12, 1]  # Black Friday to New Year
+    
+    if new_model and lifecycle == "mature":
+        return "wait", f"New model expected soon. Wait for release or price drop on current model."
+    elif in_sale_period:
+        return "buy_now", f"Good time to buy! Current sale season offers best prices."
+    elif upcoming_sales and lifecycle != "new":
+        return "wait", f"Consider waiting for {upcoming_sales[0]} for better deals."
+    elif lifecycle == "new":
+        return "buy_now", "New product at peak value. Buy now if you need the latest features."
+    elif lifecycle == "end_of_life":
+        return "consider_alternatives", "Product is aging. Consider newer alternatives unless price is very attractive."
+    else:
+        return "buy_now", "Product is at a stable point in its lifecycle. Safe to purchase."
+
+
+def _assess_deal_quality(current_month: int) -> str:
+    """Assess current deal quality based on timing"""
+    excellent_months = [11, 12]  # Black Friday, Christmas
+    good_months = [1, 6, 7]  # New Year, Mid-year sales
+    
+    if current_month in excellent_months:
+        return "excellent"
+    elif current_month in good_months:
+        return "good"
+    else:
+        return "normal"
+
+
+@lru_cache(maxsize=4096)
+def _timing_core(product_lower: str, month: int, year: int) -> Tuple[str, str, str, bool, Optional[str], Tuple[str, ...], str]:
+    """Compute every date-dependent timing field for a product.
+
+    The result depends only on the lowercased name and the current month and
+    year, so repeat lookups are served from the cache until the month rolls over.
+    Returns (lifecycle_stage, recommendation, reasoning, new_model_expected,
+    release_window, best_sale_periods, deal_quality).
+    """
+    lifecycle_stage = _determine_lifecycle(product_lower, year)
+    best_sale_periods = _get_upcoming_sales(month)
+    new_model_expected, release_window = _check_new_model(product_lower, month, year)
+    recommendation, reasoning = _generate_recommendation(
+        lifecycle_stage, new_model_expected, month, best_sale_periods
+    )
+    deal_quality = _assess_deal_quality(month)
+    return (lifecycle_stage, recommendation, reasoning, new_model_expected,
+            release_window, tuple(best_sale_periods), deal_quality)
 
 
 class PurchaseTimingAdvisor:
@@ -150,53 +440,18 @@ class PurchaseTimingAdvisor:
         self.client = groq_client
         self.config = config
         
-        # Nigerian sale periods
-        self.sale_periods = {
-            'black_friday': {'months': [11], 'name': 'Black Friday (November)'},
-            'boxing_day': {'months': [12], 'name': 'Boxing Day Sales (December)'},
-            'new_year': {'months': [1], 'name': 'New Year Sales (January)'},
-            'independence': {'months': [10], 'name': 'Independence Day Sales (October)'},
-            'easter': {'months': [3, 4], 'name': 'Easter Sales (March/April)'},
-            'back_to_school': {'months': [8, 9], 'name': 'Back to School (August/September)'}
-        }
-        
-        # Product release patterns (approximate)
-        self.release_patterns = {
-            'iphone': {'typical_month': 9, 'cycle_years': 1},
-            'samsung galaxy': {'typical_month': 2, 'cycle_years': 1},
-            'pixel': {'typical_month': 10, 'cycle_years': 1},
-            'macbook': {'typical_month': 6, 'cycle_years': 1.5},
-            'ipad': {'typical_month': 3, 'cycle_years': 1.5},
-            'playstation': {'typical_month': 11, 'cycle_years': 7},
-            'xbox': {'typical_month': 11, 'cycle_years': 7},
-        }
+        self.sale_periods = SALE_PERIODS
+        self.release_patterns = RELEASE_PATTERNS
     
     def get_timing_advice(self, product_name: str, current_price: Optional[float] = None, 
                          context: str = "") -> PurchaseTimingAdvice:
         """Generate purchase timing recommendation"""
-        product_lower = product_name.lower()
-        current_month = datetime.now(timezone.utc).month
-        
-        # Determine lifecycle stage
-        lifecycle_stage = self._determine_lifecycle(product_lower)
-        
-        # Find upcoming sales
-        best_sale_periods = self._get_upcoming_sales(current_month)
-        
-        # Check for new model timing
-        new_model_expected, release_window = self._check_new_model(product_lower)
-        
-        # Determine price trend (simplified)
-        price_trend = "stable"
-        
-        # Generate recommendation
-        recommendation, reasoning = self._generate_recommendation(
-            lifecycle_stage, new_model_expected, current_month, best_sale_periods
+        now = datetime.now(timezone.utc)
+        (lifecycle_stage, recommendation, reasoning, new_model_expected,
+         release_window, best_sale_periods, deal_quality) = _timing_core(
+            product_name.lower(), now.month, now.year
         )
         
-        # Determine deal quality
-        deal_quality = self._assess_deal_quality(current_month)
-        
         return PurchaseTimingAdvice(
             product_name=product_name,
             lifecycle_stage=lifecycle_stage,
@@ -204,101 +459,91 @@ class PurchaseTimingAdvisor:
             reasoning=reasoning,
             new_model_expected=new_model_expected,
             expected_release_window=release_window,
-            best_sale_periods=best_sale_periods,
+            best_sale_periods=list(best_sale_periods),
             current_deal_quality=deal_quality,
-            price_trend=price_trend,
+            price_trend="stable",  # simplified
             confidence=0.7 if new_model_expected else 0.5
         )
-    
-    def _determine_lifecycle(self, product_lower: str) -> str:
-        """Determine product lifecycle stage"""
-        current_year = datetime.now(timezone.utc).year
-        
-        for year in range(current_year, current_year - 5, -1):
-            if str(year) in product_lower:
-                age = current_year - year
-                if age == 0:
-                    return "new"
-                elif age == 1:
-                    return "mature"
-                elif age >= 2:
-                    return "end_of_life"
-        
-        if any(word in product_lower for word in ['latest', 'new', '2024', '2025']):
-            return "new"
-        elif any(word in product_lower for word in ['previous', 'last gen', 'older']):
-            return "end_of_life"
-        
-        return "mature"
-    
-    def _get_upcoming_sales(self, current_month: int) -> List[str]:
-        """Get upcoming sale periods"""
-        upcoming = []
-        months_to_check = [(current_month + i - 1) % 12 + 1 for i in range(6)]
-        
-        for period_name, period_info in self.sale_periods.items():
-            if any(month in period_info['months'] for month in months_to_check[:4]):
-                upcoming.append(period_info['name'])
-        
-        return upcoming[:3]
-    
-    def _check_new_model(self, product_lower: str) -> Tuple[bool, Optional[str]]:
-        """Check if new model might be coming"""
-        current_month = datetime.now(timezone.utc).month
-        
-        for product_type, pattern in self.release_patterns.items():
-            if product_type in product_lower:
-                months_until_release = (pattern['typical_month'] - current_month) % 12
-                if months_until_release <= 3:
-                    quarter = (pattern['typical_month'] - 1) // 3 + 1
-                    return True, f"Q{quarter} {datetime.now(timezone.utc).year}"
-        
-        return False, None
-    
-    def _generate_recommendation(self, lifecycle: str, new_model: bool, 
-                                current_month: int, upcoming_sales: List[str]) -> Tuple[str, str]:
-        """Generate purchase recommendation"""
-        in_sale_period = current_month in [11, 12, 1]  # Black Friday to New Year
-        
-        if new_model and lifecycle == "mature":
-            return "wait", f"New model expected soon. Wait for release or price drop on current model."
-        elif in_sale_period:
-            return "buy_now", f"Good time to buy! Current sale season offers best prices."
-        elif upcoming_sales and lifecycle != "new":
-            return "wait", f"Consider waiting for {upcoming_sales[0]} for better deals."
-        elif lifecycle == "new":
-            return "buy_now", "New product at peak value. Buy now if you need the latest features."
-        elif lifecycle == "end_of_life":
-            return "consider_alternatives", "Product is aging. Consider newer alternatives unless price is very attractive."
-        else:
-            return "buy_now", "Product is at a stable point in its lifecycle. Safe to purchase."
-    
-    def _assess_deal_quality(self, current_month: int) -> str:
-        """Assess current deal quality based on timing"""
-        excellent_months = [11, 12]  # Black Friday, Christmas
-        good_months = [1, 6, 7]  # New Year, Mid-year sales
-        
-        if current_month in excellent_months:
-            return "excellent"
-        elif current_month in good_months:
-            return "good"
-        else:
-            return "normal"
 
 
-class ResaleAnalyzer:
-    """Analyzes product resale value and depreciation trends"""
+_JSON_RESPONSE_FORMAT = {"type": "json_object"}
 
-    def __init__(self, groq_client: Groq, config: AppConfig):
+
+class BaseLLMAnalyzer(ABC):
+    """Shared plumbing for analyzers backed by a single JSON-mode Groq completion.
+
+    Subclasses implement ``build_request`` (the chat-completions body),
+    ``parse_response`` (decoded JSON -> model) and ``fallback`` (result on
+    failure), so the same prompt/parse code serves both realtime calls and
+    ``BatchAnalysisDispatcher``.
+    """
+
+    failure_message = "Analysis failed"
+    system_prompt = ""
+    temperature = 0.3
+    # str.format template; only the dynamic fields are filled in per call
+    prompt_template = ""
+
+    def __init__(self, groq_client: Groq, config: AppConfig,
+                 cache_manager: Optional[CacheManager] = None):
         self.client = groq_client
         self.config = config
+        self.cache_manager = cache_manager
+        self._system_message = {"role": "system", "content": self.system_prompt}
 
-    def analyze_resale_value(self, product_name: str, price_naira: Optional[float]) -> ResaleAnalysis:
-        """Generate resale value forecast"""
+    def _request_body(self, prompt: str) -> Dict[str, Any]:
+        return {
+            "messages": [self._system_message, {"role": "user", "content": prompt}],
+            "model": self.config.model_name,
+            "temperature": self.temperature,
+            "response_format": _JSON_RESPONSE_FORMAT
+        }
+
+    def _complete(self, request: Dict[str, Any]) -> Dict[str, Any]:
+        # Identical requests (same product, price, context) reuse the decoded
+        # response for llm_cache_ttl_hours instead of paying another round-trip
+        cache_key = None
+        if self.cache_manager is not None:
+            digest = hashlib.blake2b(orjson.dumps(request, option=orjson.OPT_SORT_KEYS), digest_size=16)
+            cache_key = f"llm:{type(self).__name__}:{digest.hexdigest()}"
+            cached = self.cache_manager.get(cache_key)
+            if cached is not None:
+                return cached
+
+        completion = self.client.chat.completions.create(**request)
+        data = orjson.loads(completion.choices[0].message.content)
+
+        if cache_key is not None:
+            self.cache_manager.set(cache_key, data, ttl_hours=self.config.llm_cache_ttl_hours)
+        return data
+
+    @abstractmethod
+    def build_request(self, *args) -> Dict[str, Any]:
+        ...
+
+    @abstractmethod
+    def parse_response(self, data: Dict[str, Any], *args) -> Any:
+        ...
+
+    @abstractmethod
+    def fallback(self, *args) -> Any:
+        ...
+
+    def _run(self, *args) -> Any:
         try:
-            current_price_desc = f"Current Price: ₦{price_naira:,.2f}" if price_naira else "Current Price: Unknown (Estimate based on market)"
-        
-            prompt = f"""
+            return self.parse_response(self._complete(self.build_request(*args)), *args)
+        except Exception as e:
+            logger.warning(f"{self.failure_message}: {e}")
+            return self.fallback(*args)
+
+
+class ResaleAnalyzer(BaseLLMAnalyzer):
+    """Analyzes product resale value and depreciation trends"""
+
+    failure_message = "Resale analysis failed"
+    system_prompt = "You are a valuation expert for consumer products in Nigeria, covering electronics, appliances, vehicles, fashion, and more."
+    temperature = 0.3
+    prompt_template = """
             Analyze the potential resale value and depreciation for '{product_name}'.
             {current_price_desc}
         
@@ -316,54 +561,57 @@ class ResaleAnalyzer:
                 "verdict": "e.g. Buy New / Buy Used / Good Short-term"
             }}
             """
-        
-            completion = self.client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": "You are a valuation expert for consumer products in Nigeria, covering electronics, appliances, vehicles, fashion, and more."},
-                    {"role": "user", "content": prompt}
-                ],
-                model=self.config.model_name,
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
-        
-            data = json.loads(completion.choices[0].message.content)
-        
-            return ResaleAnalysis(
-                predicted_value_1yr=data.get("predicted_value_1yr", "Unknown"),
-                predicted_value_3yr=data.get("predicted_value_3yr", "Unknown"),
-                depreciation_rate=data.get("depreciation_rate", "Moderate"),
-                investment_score=int(data.get("investment_score", 5)),
-                verdict=data.get("verdict", "Neutral")
-            )
-        
-        except Exception as e:
-            logger.warning(f"Resale analysis failed: {e}")
-            return ResaleAnalysis(
-                predicted_value_1yr="Unknown",
-                predicted_value_3yr="Unknown",
-                depreciation_rate="Unknown",
-                investment_score=0,
-                verdict="Unknown"
-            )
 
+    def analyze_resale_value(self, product_name: str, price_naira: Optional[float]) -> ResaleAnalysis:
+        """Generate resale value forecast"""
+        return self._run(product_name, price_naira)
 
-class VideoProofFinder:
-    """Generates targeted YouTube search queries for verification"""
+    def build_request(self, product_name: str, price_naira: Optional[float]) -> Dict[str, Any]:
+        current_price_desc = f"Current Price: ₦{price_naira:,.2f}" if price_naira else "Current Price: Unknown (Estimate based on market)"
 
-    def __init__(self, groq_client: Groq, config: AppConfig):
-        self.client = groq_client
-        self.config = config
+        return self._request_body(self.prompt_template.format(
+            product_name=product_name,
+            current_price_desc=current_price_desc
+        ))
 
-    def find_video_proofs(self, product_name: str, pros: List[str], cons: List[str]) -> VideoProof:
-        """Identify key moments to verify and generate search links"""
-        try:
-            prompt = f"""
+    def parse_response(self, data: Dict[str, Any], product_name: str, price_naira: Optional[float]) -> ResaleAnalysis:
+        return ResaleAnalysis(
+            predicted_value_1yr=data.get("predicted_value_1yr", "Unknown"),
+            predicted_value_3yr=data.get("predicted_value_3yr", "Unknown"),
+            depreciation_rate=data.get("depreciation_rate", "Moderate"),
+            investment_score=int(data.get("investment_score", 5)),
+            verdict=data.get("verdict", "Neutral")
+        )
+
+    def fallback(self, product_name: str, price_naira: Optional[float]) -> ResaleAnalysis:
+        return ResaleAnalysis(
+            predicted_value_1yr="Unknown",
+            predicted_value_3yr="Unknown",
+            depreciation_rate="Unknown",
+            investment_score=0,
+            verdict="Unknown"
+        )
+
+
+_YOUTUBE_SEARCH_URL = "https://www.youtube.com/results?search_query="
+
+
+def _youtube_search_url(query: str) -> str:
+    """YouTube results URL for ``query``; same encoding as quote_plus, minus its per-call setup"""
+    return _YOUTUBE_SEARCH_URL + quote_from_bytes(query.encode("utf-8"), " ").replace(" ", "+")
+
+class VideoProofFinder(BaseLLMAnalyzer):
+    """Generates targeted YouTube search queries for verification"""
+
+    failure_message = "Video proof finding failed"
+    system_prompt = "You are a product reviewer creating verification guides for any product category."
+    temperature = 0.3
+    prompt_template = """
             Identify 3-5 specific "Video Proof" moments for '{product_name}' that a user should watch to verify claims.
             Focus on visual/audible tests (e.g., Camera Zoom, Mic Quality, hinge durability, screen brightness).
         
-            Pros: {json.dumps(pros)}
-            Cons: {json.dumps(cons)}
+            Pros: {pros}
+            Cons: {cons}
         
             Return JSON matching this schema:
             {{
@@ -376,49 +624,45 @@ class VideoProofFinder:
                 ]
             }}
             """
-        
-            completion = self.client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": "You are a product reviewer creating verification guides for any product category."},
-                    {"role": "user", "content": prompt}
-                ],
-                model=self.config.model_name,
-                temperature=0.3,
-                response_format={"type": "json_object"}
+
+    def find_video_proofs(self, product_name: str, pros: List[str], cons: List[str]) -> VideoProof:
+        """Identify key moments to verify and generate search links"""
+        return self._run(product_name, pros, cons)
+
+    def build_request(self, product_name: str, pros: List[str], cons: List[str]) -> Dict[str, Any]:
+        return self._request_body(self.prompt_template.format(
+            product_name=product_name,
+            pros=orjson.dumps(pros).decode(),
+            cons=orjson.dumps(cons).decode()
+        ))
+
+    def parse_response(self, data: Dict[str, Any], product_name: str, pros: List[str], cons: List[str]) -> VideoProof:
+        raw_moments = data.get("moments", [])
+        queries = [m.get("search_query", "") for m in raw_moments]
+        urls = [_youtube_search_url(query) for query in queries]
+        moments = [
+            VideoMoment(
+                label=m.get("label", ""),
+                search_query=query,
+                youtube_url=url,
+                description=m.get("description", "")
             )
-        
-            data = json.loads(completion.choices[0].message.content)
-        
-            moments = []
-            for m in data.get("moments", []):
-                # Construct YouTube URL
-                query = quote_plus(m.get("search_query", ""))
-                url = f"https://www.youtube.com/results?search_query={query}"
-                moments.append(VideoMoment(
-                    label=m.get("label", ""),
-                    search_query=m.get("search_query", ""),
-                    youtube_url=url,
-                    description=m.get("description", "")
-                ))
-        
-            return VideoProof(moments=moments)
-        
-        except Exception as e:
-            logger.warning(f"Video proof finding failed: {e}")
-            return VideoProof(moments=[])
+            for m, query, url in zip(raw_moments, queries, urls)
+        ]
+    
+        return VideoProof(moments=moments)
 
+    def fallback(self, product_name: str, pros: List[str], cons: List[str]) -> VideoProof:
+        return VideoProof(moments=[])
 
-class FakeSpotter:
-    """Analyzes products for counterfeit risks and generates verification guides"""
 
-    def __init__(self, groq_client: Groq, config: AppConfig):
-        self.client = groq_client
-        self.config = config
+class FakeSpotter(BaseLLMAnalyzer):
+    """Analyzes products for counterfeit risks and generates verification guides"""
 
-    def analyze_authenticity(self, product_name: str, scraped_text: str) -> FakeSpotterReport:
-        """Generate counterfeit detection guide"""
-        try:
-            prompt = f"""
+    failure_message = "Fake spotter analysis failed"
+    system_prompt = "You are a counterfeit detection expert specialized in the Nigerian market, covering electronics, appliances, fashion, and other product categories."
+    temperature = 0.3
+    prompt_template = """
             Create a "Fake Spotter" guide for '{product_name}'.
             The Nigerian market has many counterfeit and refurbished products.
         
@@ -437,7 +681,7 @@ class FakeSpotter:
             3. Verification Steps: Specific checks for THIS product type
         
             Context:
-            {scraped_text[:2000]}
+            {context}
         
             Return JSON matching this schema:
             {{
@@ -453,53 +697,47 @@ class FakeSpotter:
                 ]
             }}
             """
-        
-            completion = self.client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": "You are a counterfeit detection expert specialized in the Nigerian market, covering electronics, appliances, fashion, and other product categories."},
-                    {"role": "user", "content": prompt}
-                ],
-                model=self.config.model_name,
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
-        
-            data = json.loads(completion.choices[0].message.content)
-        
-            steps = [AuthenticityCheck(**s) for s in data.get("verification_steps", [])]
-        
-            return FakeSpotterReport(
-                risk_level=data.get("risk_level", "Low"),
-                common_scams=data.get("common_scams", []),
-                verification_steps=steps
-            )
-        
-        except Exception as e:
-            logger.warning(f"Fake spotter analysis failed: {e}")
-            return FakeSpotterReport(
-                risk_level="Unknown",
-                common_scams=[],
-                verification_steps=[]
-            )
 
+    def analyze_authenticity(self, product_name: str, scraped_text: str) -> FakeSpotterReport:
+        """Generate counterfeit detection guide"""
+        return self._run(product_name, scraped_text)
 
-class VoxPopuliAnalyzer:
-    """Analyzes owner sentiment from forums like Nairaland, Reddit, and Twitter"""
+    def build_request(self, product_name: str, scraped_text: str) -> Dict[str, Any]:
+        return self._request_body(self.prompt_template.format(
+            product_name=product_name,
+            context=scraped_text[:2000]
+        ))
 
-    def __init__(self, groq_client: Groq, config: AppConfig):
-        self.client = groq_client
-        self.config = config
+    def parse_response(self, data: Dict[str, Any], product_name: str, scraped_text: str) -> FakeSpotterReport:
+        steps = [AuthenticityCheck.model_validate(s) for s in data.get("verification_steps", [])]
+    
+        return FakeSpotterReport(
+            risk_level=data.get("risk_level", "Low"),
+            common_scams=data.get("common_scams", []),
+            verification_steps=steps
+        )
 
-    def analyze_owner_sentiment(self, product_name: str, scraped_text: str) -> VoxPopuliReport:
-        """Generate forum sentiment digest"""
-        try:
-            prompt = f"""
+    def fallback(self, product_name: str, scraped_text: str) -> FakeSpotterReport:
+        return FakeSpotterReport(
+            risk_level="Unknown",
+            common_scams=[],
+            verification_steps=[]
+        )
+
+
+class VoxPopuliAnalyzer(BaseLLMAnalyzer):
+    """Analyzes owner sentiment from forums like Nairaland, Reddit, and Twitter"""
+
+    failure_message = "Vox Populi analysis failed"
+    system_prompt = "You are a forum analyst who cuts through marketing hype for any product category."
+    temperature = 0.4
+    prompt_template = """
             Act as a forum lurker on Nairaland, Reddit (r/gadgets), and Twitter/X.
             What are REAL owners saying about '{product_name}' after using it for months?
             Ignore the spec sheet. Focus on the "hidden truths" - bugs, overheating, battery drain, or surprisingly good features.
         
             Context:
-            {scraped_text[:3000]}
+            {context}
         
             Return JSON matching this schema:
             {{
@@ -520,53 +758,43 @@ class VoxPopuliAnalyzer:
                 ]
             }}
             """
-        
-            completion = self.client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": "You are a forum analyst who cuts through marketing hype for any product category."},
-                    {"role": "user", "content": prompt}
-                ],
-                model=self.config.model_name,
-                temperature=0.4,
-                response_format={"type": "json_object"}
-            )
-        
-            data = json.loads(completion.choices[0].message.content)
-        
-            opinions = [ForumOpinion(**o) for o in data.get("forum_consensus", [])]
-        
-            return VoxPopuliReport(
-                owner_verdict=data.get("owner_verdict", "No widespread consensus yet."),
-                love_it_for=data.get("love_it_for", []),
-                hate_it_for=data.get("hate_it_for", []),
-                forum_consensus=opinions
-            )
-        
-        except Exception as e:
-            logger.warning(f"Vox Populi analysis failed: {e}")
-            return VoxPopuliReport(
-                owner_verdict="Data unavailable",
-                love_it_for=[],
-                hate_it_for=[],
-                forum_consensus=[]
-            )
 
+    def analyze_owner_sentiment(self, product_name: str, scraped_text: str) -> VoxPopuliReport:
+        """Generate forum sentiment digest"""
+        return self._run(product_name, scraped_text)
 
-class SmartSwapAnalyzer:
-    """Identifies used/refurbished flagship alternatives that offer better value"""
+    def build_request(self, product_name: str, scraped_text: str) -> Dict[str, Any]:
+        return self._request_body(self.prompt_template.format(
+            product_name=product_name,
+            context=scraped_text[:MAX_CONTEXT_CHARS]
+        ))
 
-    def __init__(self, groq_client: Groq, config: AppConfig):
-        self.client = groq_client
-        self.config = config
+    def parse_response(self, data: Dict[str, Any], product_name: str, scraped_text: str) -> VoxPopuliReport:
+        opinions = [ForumOpinion.model_validate(o) for o in data.get("forum_consensus", [])]
+    
+        return VoxPopuliReport(
+            owner_verdict=data.get("owner_verdict", "No widespread consensus yet."),
+            love_it_for=data.get("love_it_for", []),
+            hate_it_for=data.get("hate_it_for", []),
+            forum_consensus=opinions
+        )
 
-    def analyze_swap_options(self, product_name: str, price_naira: float) -> SmartSwapReport:
-        """Generate Smart Swap alternatives"""
-        if not price_naira or price_naira == 0:
-            return SmartSwapReport(base_price=0, recommendation="Keep Original", swaps=[])
+    def fallback(self, product_name: str, scraped_text: str) -> VoxPopuliReport:
+        return VoxPopuliReport(
+            owner_verdict="Data unavailable",
+            love_it_for=[],
+            hate_it_for=[],
+            forum_consensus=[]
+        )
 
-        try:
-            price_str = f"{price_naira:,.0f}"
-            prompt = f"""
+
+class SmartSwapAnalyzer(BaseLLMAnalyzer):
+    """Identifies used/refurbished flagship alternatives that offer better value"""
+
+    failure_message = "Smart Swap analysis failed"
+    system_prompt = "You are a financial advisor for all product categories. You find value in used premium goods across electronics, appliances, vehicles, fashion, and more."
+    temperature = 0.3
+    prompt_template = """
 The user is considering buying a NEW '{product_name}' for ₦{price_str}.
 
 Find 2-3 USED, REFURBISHED, or OLDER PREMIUM alternatives in the SAME PRODUCT CATEGORY 
@@ -593,47 +821,46 @@ Return JSON:
     ]
 }}
 """
-        
-            completion = self.client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": "You are a financial advisor for all product categories. You find value in used premium goods across electronics, appliances, vehicles, fashion, and more."},
-                    {"role": "user", "content": prompt}
-                ],
-                model=self.config.model_name,
-                temperature=0.3,
-                response_format={"type": "json_object"}
-            )
-        
-            data = json.loads(completion.choices[0].message.content)
-        
-            swaps = [SmartSwapOption(**s) for s in data.get("swaps", [])]
-        
-            return SmartSwapReport(
-                base_price=price_naira,
-                recommendation=data.get("recommendation", "Keep Original"),
-                swaps=swaps
-            )
-        
-        except Exception as e:
-            logger.warning(f"Smart Swap analysis failed: {e}")
-            return SmartSwapReport(
-                base_price=price_naira,
-                recommendation="Keep Original",
-                swaps=[]
-            )
 
+    def analyze_swap_options(self, product_name: str, price_naira: float) -> SmartSwapReport:
+        """Generate Smart Swap alternatives"""
+        if not price_naira or price_naira == 0:
+            return SmartSwapReport(base_price=0, recommendation="Keep Original", swaps=[])
 
-class DisasterAnalyzer:
-    """Simulates random Nigerian disaster scenarios to test durability"""
+        return self._run(product_name, price_naira)
 
-    def __init__(self, groq_client: Groq, config: AppConfig):
-        self.client = groq_client
-        self.config = config
+    def build_request(self, product_name: str, price_naira: float) -> Dict[str, Any]:
+        price_str = f"{price_naira:,.0f}"
 
-    def simulate_disasters(self, product_name: str, category: str) -> WhatIfReport:
-        """Run disaster simulation"""
-        try:
-            prompt = f"""
+        return self._request_body(self.prompt_template.format(
+            product_name=product_name,
+            price_str=price_str
+        ))
+
+    def parse_response(self, data: Dict[str, Any], product_name: str, price_naira: float) -> SmartSwapReport:
+        swaps = [SmartSwapOption.model_validate(s) for s in data.get("swaps", [])]
+    
+        return SmartSwapReport(
+            base_price=price_naira,
+            recommendation=data.get("recommendation", "Keep Original"),
+            swaps=swaps
+        )
+
+    def fallback(self, product_name: str, price_naira: float) -> SmartSwapReport:
+        return SmartSwapReport(
+            base_price=price_naira,
+            recommendation="Keep Original",
+            swaps=[]
+        )
+
+
+class DisasterAnalyzer(BaseLLMAnalyzer):
+    """Simulates random Nigerian disaster scenarios to test durability"""
+
+    failure_message = "Disaster simulation failed"
+    system_prompt = "You are a stress-test engineer specializing in African operating conditions."
+    temperature = 0.5
+    prompt_template = """
             Simulate 3 realistic, culturally relevant Nigerian disaster scenarios for '{product_name}' (Category: {category}).
             Focus on Environmental Hazards (Dust/Heat), Infrastructure Failures (Power Surge), or Daily Chaos (Danfo Bus/Market Crowds).
         
@@ -653,82 +880,317 @@ class DisasterAnalyzer:
                 ]
             }}
             """
-        
-            completion = self.client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": "You are a stress-test engineer specializing in African operating conditions."},
-                    {"role": "user", "content": prompt}
-                ],
-                model=self.config.model_name,
-                temperature=0.5,
-                response_format={"type": "json_object"}
-            )
-        
-            data = json.loads(completion.choices[0].message.content)
-            scenarios = [DisasterScenario(**s) for s in data.get("scenarios", [])]
-        
-            return WhatIfReport(
-                disaster_score=data.get("disaster_score", 5),
-                scenarios=scenarios
-            )
-        except Exception as e:
-            logger.warning(f"Disaster simulation failed: {e}")
-            return WhatIfReport(disaster_score=0, scenarios=[])
 
+    def simulate_disasters(self, product_name: str, category: str) -> WhatIfReport:
+        """Run disaster simulation"""
+        return self._run(product_name, category)
+
+    def build_request(self, product_name: str, category: str) -> Dict[str, Any]:
+        return self._request_body(self.prompt_template.format(
+            product_name=product_name,
+            category=category
+        ))
 
-class NetPriceAnalyzer:
+    def parse_response(self, data: Dict[str, Any], product_name: str, category: str) -> WhatIfReport:
+        scenarios = [DisasterScenario.model_validate(s) for s in data.get("scenarios", [])]
+    
+        return WhatIfReport(
+            disaster_score=data.get("disaster_score", 5),
+            scenarios=scenarios
+        )
+
+    def fallback(self, product_name: str, category: str) -> WhatIfReport:
+        return WhatIfReport(disaster_score=0, scenarios=[])
+
+
+class NetPriceAnalyzer(BaseLLMAnalyzer):
     """Calculates upgrade cost by estimating trade-in values of predecessors"""
 
-    def __init__(self, groq_client: Groq, config: AppConfig):
-        self.client = groq_client
-        self.config = config
+    failure_message = "Net price calculation failed"
+    system_prompt = "You are a trade-in expert. You are extremely strict about product categories. You NEVER suggest phone trade-ins for non-phone products."
+    temperature = 0.1  # Lower temperature for strictness
+    prompt_template = (
+        "The user wants to buy '{product_name}' (Price: NGN {price_str}). "
+        "We need to identify potential trade-in options, but ONLY if valid for this product category. "
+        "\n\nStep 1: Identify the exact product category of '{product_name}' (e.g., Smartphone, Blender, Generator, Laptop, Shoe). "
+        "\n\nStep 2: Check if this category typically has an active 'trade-in' market in Nigeria. "
+        "   - Valid Categories: Smartphones, Laptops, Tablets, Gaming Consoles, Smartwatches, High-End Cameras. "
+        "   - Invalid Categories: Home Appliances (Blenders, Irons), Fashion, Generators, Furniture, Food, Accessories. "
+        "\n\nStep 3: "
+        "   - IF INVALID: Return an empty 'upgrade_from' list immediately. "
+        "   - IF VALID: Identify 3 common OLDER models or PREDECESSORS that users usually upgrade FROM to get '{product_name}'. "
+        "     * CRITICAL: The predecessors MUST match the exact product category. (e.g. if Laptop, list Laptops). "
+        "     * DO NOT list phones if the product is not a phone. "
+        "     * Estimate their current Used/Trade-In value in Nigeria. "
+        "\n\nReturn JSON with key 'upgrade_from' containing array of objects with device_name, estimated_value (number), and net_price (number = {current_price} minus estimated_value)"
+    )
 
     def calculate_net_price(self, product_name: str, current_price: float) -> NetPriceReport:
         """Identify predecessors and calculate net upgrade cost"""
         if not current_price:
             return NetPriceReport(upgrade_from=[])
         
-        try:
-            price_str = f"{current_price:,.0f}"
-            prompt = (
-                f"The user wants to buy '{product_name}' (Price: NGN {price_str}). "
-                f"We need to identify potential trade-in options, but ONLY if valid for this product category. "
-                f"\n\nStep 1: Identify the exact product category of '{product_name}' (e.g., Smartphone, Blender, Generator, Laptop, Shoe). "
-                f"\n\nStep 2: Check if this category typically has an active 'trade-in' market in Nigeria. "
-                f"   - Valid Categories: Smartphones, Laptops, Tablets, Gaming Consoles, Smartwatches, High-End Cameras. "
-                f"   - Invalid Categories: Home Appliances (Blenders, Irons), Fashion, Generators, Furniture, Food, Accessories. "
-                f"\n\nStep 3: "
-                f"   - IF INVALID: Return an empty 'upgrade_from' list immediately. "
-                f"   - IF VALID: Identify 3 common OLDER models or PREDECESSORS that users usually upgrade FROM to get '{product_name}'. "
-                f"     * CRITICAL: The predecessors MUST match the exact product category. (e.g. if Laptop, list Laptops). "
-                f"     * DO NOT list phones if the product is not a phone. "
-                f"     * Estimate their current Used/Trade-In value in Nigeria. "
-                f"\n\nReturn JSON with key 'upgrade_from' containing array of objects with device_name, estimated_value (number), and net_price (number = {current_price} minus estimated_value)"
-            )
-        
-            completion = self.client.chat.completions.create(
-                messages=[
-                    {"role": "system", "content": "You are a trade-in expert. You are extremely strict about product categories. You NEVER suggest phone trade-ins for non-phone products."},
-                    {"role": "user", "content": prompt}
-                ],
-                model=self.config.model_name,
-                temperature=0.1,  # Lower temperature for strictness
-                response_format={"type": "json_object"}
-            )
-        
-            data = json.loads(completion.choices[0].message.content)
-        
-            # Recalculate net_price ensuring no negatives
-            opts = []
-            for o in data.get("upgrade_from", []):
+        return self._run(product_name, current_price)
+
+    def build_request(self, product_name: str, current_price: float) -> Dict[str, Any]:
+        price_str = f"{current_price:,.0f}"
+
+        return self._request_body(self.prompt_template.format(
+            product_name=product_name,
+            price_str=price_str,
+            current_price=current_price
+        ))
+
+    def parse_response(self, data: Dict[str, Any], product_name: str, current_price: float) -> NetPriceReport:
+        # Recalculate net_price ensuring no negatives
+        opts = []
+        for o in data.get("upgrade_from", []):
+            try:
+                est_val = float(o.get("estimated_value", 0))
+            except Exception:
+                est_val = 0
+            net = max(0, current_price - est_val)
+            opts.append(TradeInOption(device_name=o.get("device_name", ""), estimated_value=est_val, net_price=net))
+    
+        return NetPriceReport(upgrade_from=opts)
+
+    def fallback(self, product_name: str, current_price: float) -> NetPriceReport:
+        return NetPriceReport(upgrade_from=[])
+
+
+class BatchAnalysisDispatcher:
+    """Runs analyzer prompts through Groq's Batch API for bulk, non-interactive jobs.
+
+    Batch requests are cheaper per token and don't count against realtime
+    rate limits, at the cost of minutes-to-hours turnaround. Results are
+    parsed with each analyzer's own ``parse_response``; jobs that fail or
+    are missing from the output fall back to the analyzer's ``fallback``.
+
+    Example:
+        dispatcher = BatchAnalysisDispatcher(client)
+        dispatcher.add("iphone-resale", resale_analyzer, "iPhone 15", 1_200_000)
+        dispatcher.add("iphone-fakes", fake_spotter, "iPhone 15", scraped_text)
+        results = dispatcher.run()
+    """
+
+    ENDPOINT = "/v1/chat/completions"
+    TERMINAL_FAILURES = ("failed", "expired", "cancelled")
+
+    def __init__(self, groq_client: Groq, completion_window: str = "24h", poll_interval: float = 30.0):
+        self.client = groq_client
+        self.completion_window = completion_window
+        self.poll_interval = poll_interval
+        self._jobs: Dict[str, Tuple[BaseLLMAnalyzer, Tuple[Any, ...]]] = {}
+
+    def add(self, custom_id: str, analyzer: BaseLLMAnalyzer, *args) -> None:
+        """Queue one analyzer call; ``args`` are what its ``analyze_*`` method takes."""
+        if custom_id in self._jobs:
+            raise ValueError(f"Duplicate batch custom_id: {custom_id}")
+        self._jobs[custom_id] = (analyzer, args)
+
+    def build_jsonl(self) -> bytes:
+        """Serialize queued jobs into the Batch API's JSONL input format."""
+        lines = [
+            orjson.dumps({
+                "custom_id": custom_id,
+                "method": "POST",
+                "url": self.ENDPOINT,
+                "body": analyzer.build_request(*args)
+            })
+            for custom_id, (analyzer, args) in self._jobs.items()
+        ]
+        return b"\n".join(lines)
+
+    def submit(self) -> str:
+        """Upload the queued jobs and start a batch; returns the batch id."""
+        batch_file = self.client.files.create(
+            file=("analyzer_batch.jsonl", self.build_jsonl()),
+            purpose="batch"
+        )
+        batch = self.client.batches.create(
+            completion_window=self.completion_window,
+            endpoint=self.ENDPOINT,
+            input_file_id=batch_file.id
+        )
+        logger.info(f"Submitted analyzer batch {batch.id} with {len(self._jobs)} requests")
+        return batch.id
+
+    def wait(self, batch_id: str, timeout: Optional[float] = None) -> Any:
+        """Poll until the batch completes; raises on failure or timeout."""
+        deadline = time.monotonic() + timeout if timeout is not None else None
+        while True:
+            batch = self.client.batches.retrieve(batch_id)
+            if batch.status == "completed":
+                return batch
+            if batch.status in self.TERMINAL_FAILURES:
+                raise RuntimeError(f"Analyzer batch {batch_id} ended with status '{batch.status}'")
+            if deadline is not None and time.monotonic() >= deadline:
+                raise TimeoutError(f"Analyzer batch {batch_id} still '{batch.status}' after {timeout}s")
+            time.sleep(self.poll_interval)
+
+    def collect(self, batch: Any) -> Dict[str, Any]:
+        """Parse a completed batch's output into analyzer models keyed by custom_id."""
+        results: Dict[str, Any] = {}
+        if batch.output_file_id:
+            content = self.client.files.content(batch.output_file_id).read()
+            for line in content.splitlines():
+                if not line.strip():
+                    continue
+                record = orjson.loads(line)
+                custom_id = record.get("custom_id")
+                job = self._jobs.get(custom_id)
+                if job is None:
+                    continue
+                analyzer, args = job
                 try:
-                    est_val = float(o.get("estimated_value", 0))
-                except Exception:
-                    est_val = 0
-                net = max(0, current_price - est_val)
-                opts.append(TradeInOption(device_name=o.get("device_name", ""), estimated_value=est_val, net_price=net))
+                    message = record["response"]["body"]["choices"][0]["message"]["content"]
+                    results[custom_id] = analyzer.parse_response(orjson.loads(message), *args)
+                except Exception as e:
+                    logger.warning(f"Batch result {custom_id} failed: {e}")
+
+        for custom_id, (analyzer, args) in self._jobs.items():
+            if custom_id not in results:
+                results[custom_id] = analyzer.fallback(*args)
+        return results
+
+    def run(self, timeout: Optional[float] = None) -> Dict[str, Any]:
+        """Submit, wait for and collect all queued jobs."""
+        if not self._jobs:
+            return {}
+        return self.collect(self.wait(self.submit(), timeout))
+
+
+class UnifiedAnalyzer(BaseLLMAnalyzer):
+    """Runs the resale, video proof, fake spotter, vox populi and disaster analyses in one completion.
+
+    The five analyses share the same product context, so one prompt that
+    carries it once replaces five round-trips. Each section of the combined
+    JSON is parsed by the matching analyzer, so results have the same shape
+    as the individual calls.
+    """
+
+    failure_message = "Unified analysis failed"
+    system_prompt = "You are a Nigerian consumer product expert covering valuation, counterfeit detection, owner sentiment and durability for any product category."
+    temperature = 0.3
+    prompt_template = """
+            Produce five analyses of '{product_name}' for a buyer in Nigeria.
+            {current_price_desc}
+            Category: {category}
+            Pros: {pros}
+            Cons: {cons}
         
-            return NetPriceReport(upgrade_from=opts)
-        except Exception as e:
-            logger.warning(f"Net price calculation failed: {e}")
-            return NetPriceReport(upgrade_from=[])
+            Context:
+            {context}
+        
+            1. resale: Resale value and depreciation, considering brand value retention,
+               typical depreciation for the category and demand in the Nigerian used market.
+            2. video_proof: 3-5 specific visual/audible tests a buyer should watch on YouTube to verify claims.
+            3. fake_spotter: Counterfeit risk, 2-3 scams and verification checks SPECIFIC to this
+               exact product type. Do not use generic examples.
+            4. vox_populi: What real owners on Nairaland, Reddit and Twitter/X say after months of use -
+               the hidden truths, not the spec sheet.
+            5. disaster: 3 realistic Nigerian disaster scenarios (dust/heat, power surge, Danfo/market chaos)
+               and whether the product survives, based on its known durability.
+        
+            Return JSON matching this schema:
+            {{
+                "resale": {{
+                    "predicted_value_1yr": "e.g. 75% (approx ₦XXX,XXX)",
+                    "predicted_value_3yr": "e.g. 45% (approx ₦XXX,XXX)",
+                    "depreciation_rate": "Fast/Moderate/Slow",
+                    "investment_score": 0-10 (integer, 10=excellent retention),
+                    "verdict": "e.g. Buy New / Buy Used / Good Short-term"
+                }},
+                "video_proof": {{
+                    "moments": [
+                        {{"label": "e.g. 50x Zoom Test", "search_query": "e.g. {product_name} 50x zoom camera test", "description": "What to watch for"}}
+                    ]
+                }},
+                "fake_spotter": {{
+                    "risk_level": "High/Medium/Low",
+                    "common_scams": ["Specific scam for this product"],
+                    "verification_steps": [
+                        {{"check_type": "Physical/Software/Serial/Packaging", "instruction": "Specific check", "expected_result": "What authentic product should show", "warning_sign": "What indicates counterfeit"}}
+                    ]
+                }},
+                "vox_populi": {{
+                    "owner_verdict": "One-sentence owner verdict",
+                    "love_it_for": ["Feature 1"],
+                    "hate_it_for": ["Complaint 1"],
+                    "forum_consensus": [
+                        {{"platform": "Nairaland", "sentiment": "Positive/Mixed/Negative", "key_takeaway": "Main takeaway"}}
+                    ]
+                }},
+                "disaster": {{
+                    "disaster_score": 7, (Overall resilience 1-10)
+                    "scenarios": [
+                        {{"name": "The Danfo Drop", "scenario": "What happens", "outcome": "Cracked Screen", "repair_cost_estimate": "NGN 120,000", "survivability_score": 4}}
+                    ]
+                }}
+            }}
+            """
+
+    def __init__(self, groq_client: Groq, config: AppConfig,
+                 resale_analyzer: ResaleAnalyzer,
+                 video_finder: VideoProofFinder,
+                 fake_spotter: FakeSpotter,
+                 vox_analyzer: VoxPopuliAnalyzer,
+                 disaster_analyzer: DisasterAnalyzer,
+                 cache_manager: Optional[CacheManager] = None):
+        super().__init__(groq_client, config, cache_manager)
+        self.resale_analyzer = resale_analyzer
+        self.video_finder = video_finder
+        self.fake_spotter = fake_spotter
+        self.vox_analyzer = vox_analyzer
+        self.disaster_analyzer = disaster_analyzer
+
+    def analyze_all(self, product_name: str, price_naira: Optional[float], category: str,
+                    scraped_text: str, pros: List[str], cons: List[str]) -> Dict[str, Any]:
+        """Return a dict with keys resale, video_proof, fake_spotter, vox_populi and disaster"""
+        return self._run(product_name, price_naira, category, scraped_text, pros, cons)
+
+    def _sections(self, product_name: str, price_naira: Optional[float], category: str,
+                  scraped_text: str, pros: List[str], cons: List[str]) -> Dict[str, Tuple[BaseLLMAnalyzer, Tuple[Any, ...]]]:
+        return {
+            "resale": (self.resale_analyzer, (product_name, price_naira)),
+            "video_proof": (self.video_finder, (product_name, pros, cons)),
+            "fake_spotter": (self.fake_spotter, (product_name, scraped_text)),
+            "vox_populi": (self.vox_analyzer, (product_name, scraped_text)),
+            "disaster": (self.disaster_analyzer, (product_name, category)),
+        }
+
+    def build_request(self, product_name: str, price_naira: Optional[float], category: str,
+                      scraped_text: str, pros: List[str], cons: List[str]) -> Dict[str, Any]:
+        current_price_desc = f"Current Price: ₦{price_naira:,.2f}" if price_naira else "Current Price: Unknown (Estimate based on market)"
+
+        return self._request_body(self.prompt_template.format(
+            product_name=product_name,
+            current_price_desc=current_price_desc,
+            category=category,
+            pros=orjson.dumps(pros).decode(),
+            cons=orjson.dumps(cons).decode(),
+            context=scraped_text[:MAX_CONTEXT_CHARS]
+        ))
+
+    def parse_response(self, data: Dict[str, Any], *args) -> Dict[str, Any]:
+        results = {}
+        for section, (analyzer, section_args) in self._sections(*args).items():
+            try:
+                results[section] = analyzer.parse_response(data.get(section) or {}, *section_args)
+            except Exception as e:
+                logger.warning(f"Unified analysis section '{section}' failed: {e}")
+                results[section] = self._section_fallback(analyzer, section_args)
+        return results
+
+    def fallback(self, *args) -> Dict[str, Any]:
+        return {
+            section: self._section_fallback(analyzer, section_args)
+            for section, (analyzer, section_args) in self._sections(*args).items()
+        }
+
+    @staticmethod
+    def _section_fallback(analyzer: BaseLLMAnalyzer, args: Tuple[Any, ...]) -> Any:
+        try:
+            return analyzer.fallback(*args)
+        except Exception:
+            return None
@@ -2,58 +2,119 @@
 Cache management for API responses and data.
 """
 
+import atexit
 import hashlib
-import json
 import logging
+import os
+import tempfile
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone, timedelta
 from pathlib import Path
-from typing import Optional, Any, Dict
-from functools import wraps
-from contextlib import contextmanager
+from typing import Optional, Any, Dict, Tuple
+from functools import lru_cache, wraps
+from contextlib import contextmanager, suppress
+
+import orjson
 
 from core.config import AppConfig
 
 logger = logging.getLogger(__name__)
 
+# Match json.dump's leniency for int/float dict keys
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+# One writer thread for every CacheManager, so flushes land on disk in the
+# order they were taken and instances don't each hold an idle thread
+_IO_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="cache-io")
+
+
+@lru_cache(maxsize=8192)
+def _hash_key(key: str) -> str:
+    """Filename-safe 128-bit digest of a cache key (memoized; keys recur)."""
+    return hashlib.blake2b(key.encode(), digest_size=16).hexdigest()
+
 
 class CacheManager:
-    """Manages caching for API responses and scraped data."""
+    """Manages caching for API responses and scraped data.
+
+    Disk writes are batched: ``set`` marks entries dirty and a background
+    thread writes them out every ``FLUSH_INTERVAL_SECONDS`` (and once more at
+    app shutdown / exit). Each file is replaced atomically. Long-lived code
+    should use ``get_shared_cache_manager`` rather than building its own.
+    A disabled manager stores nothing; a ``memory_only`` one never touches disk.
+    """
+
+    FLUSH_INTERVAL_SECONDS = 5.0
     
-    def __init__(self, config: AppConfig, cache_dir: str = ".cache"):
+    def __init__(
+        self,
+        config: AppConfig,
+        cache_dir: str = ".cache",
+        enabled: bool = True,
+        memory_only: bool = False,
+    ):
         self.config = config
+        self.enabled = enabled
+        self.memory_only = memory_only
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
-        self.memory_cache: Dict[str, dict] = {}
+        if not memory_only:
+            self.cache_dir.mkdir(exist_ok=True)
+        self.memory_cache: "OrderedDict[str, dict]" = OrderedDict()
+        # Guards memory_cache; analyzers and routes share it across threads
+        self._memory_lock = threading.Lock()
+        # Entries written to memory but not yet to disk, keyed by hashed key
+        self._dirty: Dict[str, dict] = {}
+        self._dirty_lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        # Weakly registered so periodic and exit flushes reach every live
+        # instance without keeping dropped ones alive
+        _live_managers.add(self)
+        _ensure_flusher()
     
     def _get_cache_key(self, key: str) -> str:
         """Generate a hash-based cache key."""
-        return hashlib.md5(key.encode()).hexdigest()
+        return _hash_key(key)
     
-    def _get_cache_path(self, key: str) -> Path:
-        """Get the file path for a cache entry."""
-        return self.cache_dir / f"{self._get_cache_key(key)}.json"
+    def _path_from_hash(self, cache_key: str) -> Path:
+        """Get the file path for an already-hashed cache key."""
+        return self.cache_dir / f"{cache_key}.json"
     
     def get(self, key: str) -> Optional[Any]:
         """Get a value from cache (memory first, then disk)."""
+        if not self.enabled:
+            return None
+        
         cache_key = self._get_cache_key(key)
         
         # Check memory cache first
-        if cache_key in self.memory_cache:
-            entry = self.memory_cache[cache_key]
-            if self._is_valid(entry):
-                return entry.get('data')
-            else:
+        with self._memory_lock:
+            entry = self.memory_cache.get(cache_key)
+            if entry is not None:
+                if self._is_valid(entry):
+                    self.memory_cache.move_to_end(cache_key)
+                    return entry.get('data')
                 del self.memory_cache[cache_key]
         
+        # An entry evicted from memory may still be waiting to be flushed
+        entry = self._dirty.get(cache_key)
+        if entry is not None and self._is_valid(entry):
+            return entry.get('data')
+        
+        if self.memory_only:
+            return None
+        
         # Check disk cache
-        cache_path = self._get_cache_path(key)
+        cache_path = self._path_from_hash(cache_key)
         if cache_path.exists():
             try:
-                with open(cache_path, 'r', encoding='utf-8') as f:
-                    entry = json.load(f)
+                entry = orjson.loads(cache_path.read_bytes())
                 if self._is_valid(entry):
                     # Promote to memory cache
-                    self.memory_cache[cache_key] = entry
+                    self._remember(cache_key, entry)
                     return entry.get('data')
                 else:
                     cache_path.unlink()  # Delete expired cache
@@ -62,35 +123,86 @@ class CacheManager:
         
         return None
     
-    def set(self, key: str, data: Any, ttl_hours: Optional[int] = None) -> None:
-        """Set a value in cache (both memory and disk)."""
+    def set(
+        self,
+        key: str,
+        data: Any,
+        ttl_hours: Optional[int] = None,
+        memory_only: bool = False,
+    ) -> None:
+        """Set a value in cache (memory, and disk unless ``memory_only``)."""
+        if not self.enabled:
+            return
+        
         ttl = ttl_hours or self.config.cache_ttl_hours
         cache_key = self._get_cache_key(key)
         
         entry = {
             'data': data,
             'timestamp': datetime.now(timezone.utc).isoformat(),
-            'ttl_hours': ttl
+            'ttl_hours': ttl,
+            'expiry_ts': time.time() + ttl * 3600,
         }
         
         # Store in memory
-        self.memory_cache[cache_key] = entry
+        self._remember(cache_key, entry)
+        
+        # Queue for disk
+        with self._dirty_lock:
+            if memory_only or self.memory_only:
+                self._dirty.pop(cache_key, None)
+                return
+            self._dirty[cache_key] = entry
+            now = time.monotonic()
+            if now - self._last_flush < self.FLUSH_INTERVAL_SECONDS:
+                return
+            self._last_flush = now
         
-        # Enforce cache size limit
-        if len(self.memory_cache) > self.config.cache_max_size:
-            oldest_key = next(iter(self.memory_cache))
-            del self.memory_cache[oldest_key]
+        try:
+            _IO_POOL.submit(self.flush)
+        except RuntimeError:
+            # Interpreter shutting down; the atexit flush picks it up
+            pass
+    
+    def _remember(self, cache_key: str, entry: dict) -> None:
+        """Insert as most recently used, evicting the LRU entry if over size."""
+        with self._memory_lock:
+            self.memory_cache[cache_key] = entry
+            self.memory_cache.move_to_end(cache_key)
+            if len(self.memory_cache) > self.config.cache_max_size:
+                self.memory_cache.popitem(last=False)
+    
+    def flush(self) -> None:
+        """Write all dirty entries to disk."""
+        with self._dirty_lock:
+            pending, self._dirty = self._dirty, {}
+            self._last_flush = time.monotonic()
         
-        # Store on disk
+        for cache_key, entry in pending.items():
+            try:
+                self._write_to_disk(self._path_from_hash(cache_key), entry)
+            except Exception as e:
+                logger.warning(f"Cache write error: {e}")
+    
+    def _write_to_disk(self, cache_path: Path, entry: dict) -> None:
+        """Write an entry via a temp file so readers never see a partial file."""
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
         try:
-            cache_path = self._get_cache_path(key)
-            with open(cache_path, 'w', encoding='utf-8') as f:
-                json.dump(entry, f)
-        except Exception as e:
-            logger.warning(f"Cache write error: {e}")
+            with os.fdopen(fd, 'wb') as f:
+                f.write(orjson.dumps(entry, option=_ORJSON_OPTIONS))
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            with suppress(OSError):
+                os.unlink(tmp_path)
+            raise
     
     def _is_valid(self, entry: dict) -> bool:
         """Check if a cache entry is still valid."""
+        expiry_ts = entry.get('expiry_ts')
+        if expiry_ts is not None:
+            return time.time() < expiry_ts
+        
+        # Entries written before expiry_ts existed
         try:
             timestamp_str = entry.get('timestamp', '')
             if timestamp_str.endswith('Z'):
@@ -106,7 +218,10 @@ class CacheManager:
     
     def clear(self) -> None:
         """Clear all cache entries."""
-        self.memory_cache.clear()
+        with self._memory_lock:
+            self.memory_cache.clear()
+        with self._dirty_lock:
+            self._dirty.clear()
         for cache_file in self.cache_dir.glob("*.json"):
             try:
                 cache_file.unlink()
@@ -116,10 +231,12 @@ class CacheManager:
     def invalidate(self, key: str) -> None:
         """Invalidate a specific cache entry."""
         cache_key = self._get_cache_key(key)
-        if cache_key in self.memory_cache:
-            del self.memory_cache[cache_key]
+        with self._memory_lock:
+            self.memory_cache.pop(cache_key, None)
+        with self._dirty_lock:
+            self._dirty.pop(cache_key, None)
         
-        cache_path = self._get_cache_path(key)
+        cache_path = self._path_from_hash(cache_key)
         if cache_path.exists():
             try:
                 cache_path.unlink()
@@ -127,16 +244,78 @@ class CacheManager:
                 pass
 
 
-def cached(cache_manager: CacheManager, key_prefix: str = ""):
-    """Decorator for caching function results."""
+_live_managers: "weakref.WeakSet[CacheManager]" = weakref.WeakSet()
+_shared_managers: Dict[Tuple[AppConfig, str], CacheManager] = {}
+_shared_managers_lock = threading.Lock()
+_flusher_lock = threading.Lock()
+_flusher: Optional[threading.Thread] = None
+
+
+def get_shared_cache_manager(config: AppConfig, cache_dir: str = ".cache") -> CacheManager:
+    """Return the process-wide CacheManager for ``config`` and ``cache_dir``.
+
+    Services are built per request; sharing the manager keeps one memory
+    cache (and one set of pending writes) instead of one per request.
+    """
+    with _shared_managers_lock:
+        manager = _shared_managers.get((config, cache_dir))
+        if manager is None:
+            manager = CacheManager(config, cache_dir)
+            _shared_managers[(config, cache_dir)] = manager
+        return manager
+
+
+def flush_all_caches() -> None:
+    """Write pending entries of every live CacheManager to disk."""
+    for manager in list(_live_managers):
+        manager.flush()
+
+
+def _flush_loop() -> None:
+    """Periodically flush so a burst's last writes don't wait for the next set()."""
+    while True:
+        time.sleep(CacheManager.FLUSH_INTERVAL_SECONDS)
+        try:
+            _IO_POOL.submit(flush_all_caches)
+        except RuntimeError:
+            return  # Interpreter shutting down; the atexit flush takes over
+
+
+def _ensure_flusher() -> None:
+    """Start the periodic flush thread once per process."""
+    global _flusher
+    with _flusher_lock:
+        if _flusher is None:
+            _flusher = threading.Thread(target=_flush_loop, name="cache-flusher", daemon=True)
+            _flusher.start()
+
+
+atexit.register(flush_all_caches)
+
+
+def cached(
+    cache_manager: Optional[CacheManager],
+    key_prefix: str = "",
+    memory_only: bool = False,
+):
+    """Decorator for caching function results.
+
+    Passing ``None`` or a disabled manager makes the wrapper a plain call.
+    """
     def decorator(func):
+        # Key prefix is fixed per function; only the arguments vary per call
+        base = f"{key_prefix}:{func.__name__}:"
+        
         @wraps(func)
         def wrapper(*args, **kwargs):
+            if cache_manager is None or not cache_manager.enabled:
+                return func(*args, **kwargs)
+            
             # Generate cache key from function name and arguments
-            key_parts = [key_prefix, func.__name__]
-            key_parts.extend(str(arg) for arg in args)
-            key_parts.extend(f"{k}={v}" for k, v in sorted(kwargs.items()))
-            cache_key = ":".join(key_parts)
+            if kwargs:
+                cache_key = base + repr(args) + repr(sorted(kwargs.items()))
+            else:
+                cache_key = base + repr(args)
             
             # Try to get from cache
             cached_result = cache_manager.get(cache_key)
@@ -146,7 +325,7 @@ def cached(cache_manager: CacheManager, key_prefix: str = ""):
             # Execute function and cache result
             result = func(*args, **kwargs)
             if result is not None:
-                cache_manager.set(cache_key, result)
+                cache_manager.set(cache_key, result, memory_only=memory_only)
             
             return result
         return wrapper
@@ -156,9 +335,10 @@ def cached(cache_manager: CacheManager, key_prefix: str = ""):
 @contextmanager
 def timed_operation(name: str):
     """Context manager for timing operations."""
-    start = datetime.now(timezone.utc)
+    start = time.perf_counter()
     try:
         yield
     finally:
-        elapsed = (datetime.now(timezone.utc) - start).total_seconds()
-        logger.debug(f"{name} completed in {elapsed:.2f}s")
+        if logger.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - start
+            logger.debug(f"{name} completed in {elapsed:.2f}s")
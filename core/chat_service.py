@@ -5,6 +5,7 @@ Interactive chat services for product queries with real-time web search integrat
 import re
 import logging
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import List, Dict, Optional, Any, TYPE_CHECKING
 
 from groq import Groq
@@ -23,20 +24,35 @@ class AIGenerationError(Exception):
     pass
 
 
-# Common filler phrases to remove from LLM responses
-FILLER_PHRASES = [
-    r"^As an AI( language model)?[,.]?\s*",
-    r"^I'd be happy to help[.!]?\s*",
-    r"^Great question[.!]?\s*",
-    r"^That's a great question[.!]?\s*",
-    r"^Sure[,!]?\s*",
-    r"^Of course[,!]?\s*",
-    r"^Absolutely[,!]?\s*",
-    r"\s*I hope this helps[.!]?\s*$",
-    r"\s*Let me know if you have any other questions[.!]?\s*$",
-    r"\s*Feel free to ask if you need more information[.!]?\s*$",
-    r"\s*Is there anything else you'd like to know\??\s*$",
+# Common filler phrases to remove from LLM responses (opening / closing)
+LEADING_FILLER_PHRASES = [
+    r"As an AI( language model)?[,.]?\s*",
+    r"I'd be happy to help[.!]?\s*",
+    r"Great question[.!]?\s*",
+    r"That's a great question[.!]?\s*",
+    r"Sure[,!]?\s*",
+    r"Of course[,!]?\s*",
+    r"Absolutely[,!]?\s*",
 ]
+TRAILING_FILLER_PHRASES = [
+    r"\s*I hope this helps[.!]?\s*",
+    r"\s*Let me know if you have any other questions[.!]?\s*",
+    r"\s*Feel free to ask if you need more information[.!]?\s*",
+    r"\s*Is there anything else you'd like to know\??\s*",
+]
+
+# All filler phrases fused into one pattern; repeated openers/closers are
+# stripped in a single pass
+_FILLER_RE = re.compile(
+    "^(?:" + "|".join(LEADING_FILLER_PHRASES) + ")+"
+    "|(?:" + "|".join(TRAILING_FILLER_PHRASES) + ")+$",
+    re.IGNORECASE | re.MULTILINE,
+)
+# Generation stops at the most common closers so they are never produced
+CHAT_STOP_SEQUENCES = ["I hope this helps", "Let me know if"]
+_MULTI_NEWLINE_RE = re.compile(r"\n{3,}")
+# Whitespace (other than the newline itself) at the start or end of a line
+_LINE_EDGE_WS_RE = re.compile(r"^[^\S\n]+|[^\S\n]+$", re.MULTILINE)
 
 # Keywords suggesting need for fresh/current data
 FRESH_DATA_KEYWORDS = [
@@ -47,11 +63,62 @@ FRESH_DATA_KEYWORDS = [
     '2024', '2025', 'this month', 'this week',
     'buy now', 'should i buy', 'worth buying',
 ]
+_FRESH_DATA_RE = re.compile("|".join(map(re.escape, FRESH_DATA_KEYWORDS)), re.IGNORECASE)
+
+# Keywords preserved when building a fresh-data search query
+SEARCH_TERM_KEYWORDS = [
+    'price', 'cost', 'buy', 'available', 'stock', 'discount', 'sale', 'deal', 'specs', 'review',
+]
+# Lookahead so overlapping terms are all reported, as with `in`
+_SEARCH_TERM_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, SEARCH_TERM_KEYWORDS)) + "))", re.IGNORECASE
+)
+
+_LAST_UPDATED_FORMATS = ("%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%B %d, %Y")
+
+
+@lru_cache(maxsize=1024)
+def _parse_last_updated(value: str) -> Optional[datetime]:
+    """Parse a review's last_updated string into an aware datetime, or None."""
+    for fmt in _LAST_UPDATED_FORMATS:
+        try:
+            parsed = datetime.strptime(value, fmt)
+        except ValueError:
+            continue
+        return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+    return None
 
 
 class ChatService:
     """Handles product chat conversations with real-time data capabilities"""
     
+    # Invariant part of the system prompt, shared by every chat turn
+    STATIC_PROMPT_RULES = """=== YOUR PERSONALITY ===
+- Be warm, conversational, and genuinely helpful—like a tech-savvy friend
+- Sound natural—avoid robotic or overly formal language
+- Get straight to the point—no fluff, no filler
+- Share honest opinions and practical advice
+- Use casual language but stay professional
+
+=== HOW TO RESPOND ===
+- Answer the question directly in the FIRST sentence
+- Keep responses SHORT (50-150 words for simple questions)
+- Use **bold** for important specs, prices, and key points
+- Use bullet points only when listing 3+ items
+- Be specific—use actual numbers, not vague descriptions
+
+=== CONVERSATION STYLE ===
+- Simple questions → Brief, helpful answers (1-3 sentences)
+- Complex questions → Structured with key points
+- Opinion questions → Share your recommendation with reasoning
+- Comparison questions → Quick verdict + key differences
+
+=== DON'T ===
+- Say "Confirmation:" or "Based on the data..." - just answer naturally
+- List system status or capabilities
+- Give meta-commentary about the product data
+- Be vague when you have specific information"""
+    
     def __init__(
         self, 
         groq_client: Groq, 
@@ -71,11 +138,17 @@ class ChatService:
         product_review: ProductReview,
         user_profile: Optional[UserProfile] = None,
     ) -> str:
-        """Get chat response about the product, aware of user profile and price/timing context"""
+        """Get chat response about the product, aware of user profile and price/timing context.
+
+        ``user_profile`` must already be a ``UserProfile``; callers validate
+        raw profile dicts once, upstream.
+        """
+        
+        days_old = self._compute_data_age(product_review)
         
         # Check if we need fresh data from the web
         fresh_context = ""
-        if self._needs_fresh_data(user_message, product_review):
+        if self._needs_fresh_data(user_message, days_old):
             fresh_context = self._fetch_fresh_context(
                 product_review.product_name, 
                 user_message
@@ -85,7 +158,8 @@ class ChatService:
         system_prompt = self._get_chat_system_prompt(
             product_review, 
             user_profile,
-            fresh_context
+            fresh_context,
+            days_old,
         )
         
         messages = [{"role": "system", "content": system_prompt}]
@@ -97,7 +171,8 @@ class ChatService:
                 messages=messages,
                 model=self.config.model_name,
                 temperature=self.config.temperature_chat,
-                max_tokens=self.config.max_tokens_chat
+                max_tokens=self.config.max_tokens_chat,
+                stop=CHAT_STOP_SEQUENCES,
             )
             
             raw_response = response.choices[0].message.content
@@ -111,87 +186,63 @@ class ChatService:
             logger.error(f"Chat response failed: {e}")
             raise AIGenerationError(f"Chat failed: {str(e)}")
     
-    def _needs_fresh_data(self, user_message: str, product_review: ProductReview) -> bool:
+    def _needs_fresh_data(self, user_message: str, days_old: Optional[int]) -> bool:
         """Detect if the user's question requires fresh web data."""
         if not self.web_search_client or not self.content_scraper:
             return False
         
-        message_lower = user_message.lower()
-        
         # Check if message contains fresh data keywords
-        if any(kw in message_lower for kw in FRESH_DATA_KEYWORDS):
+        if _FRESH_DATA_RE.search(user_message):
             return True
         
         # Check if data is stale (older than 7 days)
-        if self._is_data_stale(product_review, days_threshold=7):
+        if self._is_data_stale(days_old, days_threshold=7):
             return True
         
         return False
     
-    def _is_data_stale(self, product_review: ProductReview, days_threshold: int = 7) -> bool:
-        """Check if product review data is older than threshold."""
+    def _compute_data_age(self, product_review: ProductReview) -> Optional[int]:
+        """Days since the review data was updated, or None if unknown."""
         try:
             last_updated = getattr(product_review, 'last_updated', None)
             if not last_updated:
-                return True  # Unknown = assume stale
+                return None
             
             # Parse if string
             if isinstance(last_updated, str):
-                # Try multiple formats
-                for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%B %d, %Y"]:
-                    try:
-                        last_updated = datetime.strptime(last_updated, fmt)
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    return True  # Couldn't parse = assume stale
+                last_updated = _parse_last_updated(last_updated)
+                if last_updated is None:
+                    return None
             
             # Make timezone-aware if needed
             if last_updated.tzinfo is None:
                 last_updated = last_updated.replace(tzinfo=timezone.utc)
             
-            days_old = (datetime.now(timezone.utc) - last_updated).days
-            return days_old > days_threshold
+            return (datetime.now(timezone.utc) - last_updated).days
             
         except Exception:
-            return True  # On error, assume stale
+            return None
+    
+    @staticmethod
+    def _is_data_stale(days_old: Optional[int], days_threshold: int = 7) -> bool:
+        """Check if product review data is older than threshold."""
+        return days_old is None or days_old > days_threshold  # Unknown = assume stale
     
-    def _get_data_freshness_context(self, product_review: ProductReview) -> str:
+    def _get_data_freshness_context(self, product_review: ProductReview, days_old: Optional[int]) -> str:
         """Generate freshness context for the LLM."""
-        try:
-            last_updated = getattr(product_review, 'last_updated', None)
-            if not last_updated:
+        if days_old is None:
+            if not getattr(product_review, 'last_updated', None):
                 return "📊 DATA FRESHNESS: ⚠️ UNKNOWN (no timestamp available)"
-            
-            # Parse if string
-            if isinstance(last_updated, str):
-                for fmt in ["%Y-%m-%d %H:%M:%S", "%Y-%m-%dT%H:%M:%S", "%B %d, %Y"]:
-                    try:
-                        last_updated = datetime.strptime(last_updated, fmt)
-                        break
-                    except ValueError:
-                        continue
-                else:
-                    return "📊 DATA FRESHNESS: ⚠️ UNKNOWN (couldn't parse date)"
-            
-            # Make timezone-aware if needed
-            if last_updated.tzinfo is None:
-                last_updated = last_updated.replace(tzinfo=timezone.utc)
-            
-            days_old = (datetime.now(timezone.utc) - last_updated).days
-            
-            if days_old <= 1:
-                return f"📊 DATA FRESHNESS: ✅ FRESH (updated today)"
-            elif days_old <= 7:
-                return f"📊 DATA FRESHNESS: ✅ FRESH (updated {days_old} days ago)"
-            elif days_old <= 30:
-                return f"📊 DATA FRESHNESS: ⚡ RECENT (updated {days_old} days ago)"
-            else:
-                return f"📊 DATA FRESHNESS: ⚠️ POTENTIALLY OUTDATED (updated {days_old} days ago)"
-                
-        except Exception:
-            return "📊 DATA FRESHNESS: ⚠️ UNKNOWN"
+            return "📊 DATA FRESHNESS: ⚠️ UNKNOWN (couldn't parse date)"
+        
+        if days_old <= 1:
+            return f"📊 DATA FRESHNESS: ✅ FRESH (updated today)"
+        elif days_old <= 7:
+            return f"📊 DATA FRESHNESS: ✅ FRESH (updated {days_old} days ago)"
+        elif days_old <= 30:
+            return f"📊 DATA FRESHNESS: ⚡ RECENT (updated {days_old} days ago)"
+        else:
+            return f"📊 DATA FRESHNESS: ⚠️ POTENTIALLY OUTDATED (updated {days_old} days ago)"
     
     def _fetch_fresh_context(self, product_name: str, user_message: str) -> str:
         """Fetch fresh web data relevant to the user's question."""
@@ -216,17 +267,16 @@ class ChatService:
                 return ""
             
             # Format for LLM context
-            fresh_context = "\n\n🔄 REAL-TIME WEB DATA (just fetched - USE THIS FOR CURRENT INFO):\n"
+            parts = ["\n\n🔄 REAL-TIME WEB DATA (just fetched - USE THIS FOR CURRENT INFO):\n"]
             for i, content in enumerate(scraped_content, 1):
                 # Truncate content to avoid token overflow
-                snippet = content.content[:400].strip()
-                if len(content.content) > 400:
-                    snippet += "..."
-                fresh_context += f"\n[Source {i}]: {content.title}\n{snippet}\n"
+                text = content.content
+                snippet = text[:400].strip() + ("..." if len(text) > 400 else "")
+                parts.append(f"\n[Source {i}]: {content.title}\n{snippet}\n")
             
-            fresh_context += "\n⚠️ IMPORTANT: Use the REAL-TIME WEB DATA above for current prices, availability, and recent information.\n"
+            parts.append("\n⚠️ IMPORTANT: Use the REAL-TIME WEB DATA above for current prices, availability, and recent information.\n")
             
-            return fresh_context
+            return "".join(parts)
             
         except Exception as e:
             logger.warning(f"Failed to fetch fresh context: {e}")
@@ -234,15 +284,8 @@ class ChatService:
     
     def _extract_search_terms(self, user_message: str) -> str:
         """Extract relevant search terms from user message."""
-        # Keywords to preserve
-        important_terms = ['price', 'cost', 'buy', 'available', 'stock', 'discount', 'sale', 'deal', 'specs', 'review']
-        
-        message_lower = user_message.lower()
-        terms = []
-        
-        for term in important_terms:
-            if term in message_lower:
-                terms.append(term)
+        found = {term.lower() for term in _SEARCH_TERM_RE.findall(user_message)}
+        terms = [term for term in SEARCH_TERM_KEYWORDS if term in found]
         
         return ' '.join(terms) if terms else 'price review'
     
@@ -254,15 +297,13 @@ class ChatService:
         cleaned = response.strip()
         
         # Remove common filler phrases
-        for pattern in FILLER_PHRASES:
-            cleaned = re.sub(pattern, '', cleaned, flags=re.IGNORECASE | re.MULTILINE)
+        cleaned = _FILLER_RE.sub('', cleaned)
         
         # Remove excessive newlines (more than 2 in a row)
-        cleaned = re.sub(r'\n{3,}', '\n\n', cleaned)
+        cleaned = _MULTI_NEWLINE_RE.sub('\n\n', cleaned)
         
         # Remove leading/trailing whitespace from each line
-        lines = [line.strip() for line in cleaned.split('\n')]
-        cleaned = '\n'.join(lines)
+        cleaned = _LINE_EDGE_WS_RE.sub('', cleaned)
         
         # Final trim
         cleaned = cleaned.strip()
@@ -273,45 +314,22 @@ class ChatService:
         self, 
         product_review: ProductReview, 
         user_profile: Optional[UserProfile] = None,
-        fresh_context: str = ""
+        fresh_context: str = "",
+        days_old: Optional[int] = None,
     ) -> str:
         current_date = datetime.now().strftime("%B %d, %Y")
-        freshness_info = self._get_data_freshness_context(product_review)
+        freshness_info = self._get_data_freshness_context(product_review, days_old)
         
-        base_prompt = f"""You are a friendly, knowledgeable shopping assistant helping users make smart buying decisions.
+        parts = [f"""You are a friendly, knowledgeable shopping assistant helping users make smart buying decisions.
 
 📅 TODAY: {current_date}
 {freshness_info}
 
-=== YOUR PERSONALITY ===
-- Be warm, conversational, and genuinely helpful—like a tech-savvy friend
-- Sound natural—avoid robotic or overly formal language
-- Get straight to the point—no fluff, no filler
-- Share honest opinions and practical advice
-- Use casual language but stay professional
-
-=== HOW TO RESPOND ===
-- Answer the question directly in the FIRST sentence
-- Keep responses SHORT (50-150 words for simple questions)
-- Use **bold** for important specs, prices, and key points
-- Use bullet points only when listing 3+ items
-- Be specific—use actual numbers, not vague descriptions
-
-=== CONVERSATION STYLE ===
-- Simple questions → Brief, helpful answers (1-3 sentences)
-- Complex questions → Structured with key points
-- Opinion questions → Share your recommendation with reasoning
-- Comparison questions → Quick verdict + key differences
-
-=== DON'T ===
-- Say "Confirmation:" or "Based on the data..." - just answer naturally
-- List system status or capabilities
-- Give meta-commentary about the product data
-- Be vague when you have specific information"""
+""", self.STATIC_PROMPT_RULES]
 
         # Add product context
         if product_review.data_source_type == 'free_web_search':
-            base_prompt += f"""
+            parts.append(f"""
 
 === PRODUCT CONTEXT ===
 - **Product**: {product_review.product_name}
@@ -319,42 +337,39 @@ class ChatService:
 - **Rating**: {product_review.predicted_rating}
 - **Price**: {product_review.price_info}
 - **Data Source**: Real-time web search
-- **Last Updated**: {product_review.last_updated or "Unknown"}"""
+- **Last Updated**: {product_review.last_updated or "Unknown"}""")
         else:
-            base_prompt += f"""
+            parts.append(f"""
 
 === PRODUCT CONTEXT ===
 - **Product**: {product_review.product_name}
 - **Data Source**: AI Knowledge Base
-- ⚠️ Note: This is from AI training data, not live web data. Verify current specs and pricing."""
+- ⚠️ Note: This is from AI training data, not live web data. Verify current specs and pricing.""")
 
         # Add fresh web data if available
         if fresh_context:
-            base_prompt += fresh_context
+            parts.append(fresh_context)
         
         # Personalization context
         if user_profile:
-            try:
-                profile = user_profile if isinstance(user_profile, UserProfile) else UserProfile(**user_profile)
-                
-                budget_text = "unknown"
-                if profile.min_budget and profile.max_budget:
-                    budget_text = f"₦{profile.min_budget:,.0f}–₦{profile.max_budget:,.0f}"
-                elif profile.max_budget:
-                    budget_text = f"up to ₦{profile.max_budget:,.0f}"
-                elif profile.min_budget:
-                    budget_text = f"from ₦{profile.min_budget:,.0f}"
-
-                base_prompt += f"""
+            profile = user_profile
+            
+            budget_text = "unknown"
+            if profile.min_budget and profile.max_budget:
+                budget_text = f"₦{profile.min_budget:,.0f}–₦{profile.max_budget:,.0f}"
+            elif profile.max_budget:
+                budget_text = f"up to ₦{profile.max_budget:,.0f}"
+            elif profile.min_budget:
+                budget_text = f"from ₦{profile.min_budget:,.0f}"
+
+            parts.append(f"""
 
 === USER PROFILE (personalize answers to this) ===
 - **Budget**: {budget_text}
 - **Use Cases**: {', '.join(profile.use_cases) if profile.use_cases else 'not specified'}
 - **Preferred Brands**: {', '.join(profile.preferred_brands) if profile.preferred_brands else 'none'}
 
-When answering "is it worth it?" or "should I buy?", ALWAYS reference this profile."""
-            except Exception:
-                pass
+When answering "is it worth it?" or "should I buy?", ALWAYS reference this profile.""")
 
         # Enhanced product signals
         if hasattr(product_review, "timing_advice") or hasattr(product_review, "red_flag_report"):
@@ -370,12 +385,12 @@ When answering "is it worth it?" or "should I buy?", ALWAYS reference this profi
                 risk_note = f"Risk Level: {risk.overall_risk_level.title()}"
             
             if timing_note or risk_note:
-                base_prompt += f"""
+                parts.append(f"""
 
 === BUYING SIGNALS ===
 - {timing_note or 'No timing data'}
 - {risk_note or 'No risk assessment'}
 
-Reference these signals when answering "Should I wait?" or "Is it risky?" questions."""
+Reference these signals when answering "Should I wait?" or "Is it risky?" questions.""")
 
-        return base_prompt
+        return "".join(parts)
@@ -3,12 +3,54 @@ Currency formatting and conversion utilities.
 """
 
 import re
-import requests
+from functools import lru_cache
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Optional, Tuple
 
 from core.config import Constants
 
+# Precompiled price-parsing patterns
+_NUMBER_RE = re.compile(r'[\d.]+')
+# A _NUMBER_RE match that float() accepts ("1.", ".5" yes; "." or "1.2.3" no)
+_FLOAT_TOKEN_RE = re.compile(r'\d+\.?\d*|\.\d+')
+_NAIRA_STRIP_RE = re.compile(r'[₦, ]|NGN')
+_CURRENCY_STRIP_RE = re.compile(r'[₦$€£]|NGN|USD|EUR|GBP|CAD|AUD')
+
+# Currency markers in detection priority order: the highest-priority currency
+# with a marker anywhere in the string wins, wherever it appears
+_CURRENCY_MARKERS = (
+    ("₦", "NGN"), ("NGN", "NGN"),
+    ("$", "USD"), ("USD", "USD"),
+    ("€", "EUR"), ("EUR", "EUR"),
+    ("£", "GBP"), ("GBP", "GBP"),
+    ("CAD", "CAD"), ("C$", "CAD"),
+    ("AUD", "AUD"), ("A$", "AUD"),
+)
+_MARKER_RANK = {marker: rank for rank, (marker, _) in enumerate(_CURRENCY_MARKERS)}
+_MARKER_CODE = dict(_CURRENCY_MARKERS)
+_CURRENCY_RE = re.compile(
+    "(?=(" + "|".join(re.escape(marker) for marker, _ in _CURRENCY_MARKERS) + "))",
+    re.IGNORECASE,
+)
+
+# Shared FX rates entry in the app cache (survives restarts, shared by workers)
+_FX_RATES_CACHE_KEY = "fx_rates_usd"
+_FX_RATES_TTL = timedelta(hours=1)
+
+
+def _first_number(cleaned: str) -> Optional[float]:
+    """First numeric run in ``cleaned`` as a float, or None if it isn't one."""
+    match = _NUMBER_RE.search(cleaned)
+    if match is None or not _FLOAT_TOKEN_RE.fullmatch(match.group()):
+        return None
+    return float(match.group())
+
+
+@lru_cache(maxsize=4096)
+def _format_naira(amount: float, show_symbol: bool) -> str:
+    """Cached worker for CurrencyFormatter.format_naira (prices repeat across renders)."""
+    return f"₦{amount:,.0f}" if show_symbol else f"{amount:,.0f}"
+
 
 class CurrencyFormatter:
     """Handles Nigerian Naira formatting and currency conversion"""
@@ -24,31 +66,20 @@ class CurrencyFormatter:
         if amount is None:
             return "Price unavailable"
         
-        formatted = f"{amount:,.0f}"
-        
-        if show_symbol:
-            return f"₦{formatted}"
-        return formatted
+        return _format_naira(amount, show_symbol)
     
     @staticmethod
     def parse_naira(price_string: str) -> Optional[float]:
         """Parse Naira price string to float"""
-        if not price_string:
+        if not price_string or not isinstance(price_string, str):
             return None
         
-        try:
-            cleaned = price_string.replace('₦', '').replace('NGN', '')
-            cleaned = cleaned.replace(',', '').replace(' ', '').strip()
-            
-            if '-' in cleaned:
-                cleaned = cleaned.split('-')[0]
-            
-            match = re.search(r'[\d.]+', cleaned)
-            if match:
-                return float(match.group())
-            return None
-        except:
-            return None
+        cleaned = _NAIRA_STRIP_RE.sub('', price_string).strip()
+        
+        if '-' in cleaned:
+            cleaned = cleaned.split('-')[0]
+        
+        return _first_number(cleaned)
     
     def _get_usd_rates(self) -> Dict[str, float]:
         """Fetch and cache FX rates with USD as base."""
@@ -56,10 +87,22 @@ class CurrencyFormatter:
         logger = logging.getLogger(__name__)
         
         if self._rates and self._rates_timestamp:
-            if datetime.now(timezone.utc) - self._rates_timestamp < timedelta(hours=1):
+            if datetime.now(timezone.utc) - self._rates_timestamp < _FX_RATES_TTL:
                 return self._rates
 
+        if self.cache:
+            cached = self.cache.get(_FX_RATES_CACHE_KEY)
+            if cached and cached.get('rates') and cached.get('fetched_at'):
+                fetched_at = datetime.fromtimestamp(cached['fetched_at'], timezone.utc)
+                if datetime.now(timezone.utc) - fetched_at < _FX_RATES_TTL:
+                    self._rates = cached['rates']
+                    self._rates_timestamp = fetched_at
+                    return self._rates
+
         try:
+            # Imported lazily: only a rates refresh needs the HTTP stack
+            import requests
+            
             response = requests.get(
                 "https://api.exchangerate-api.com/v4/latest/USD",
                 timeout=5
@@ -74,6 +117,12 @@ class CurrencyFormatter:
                     logger.info(f"✓ Fetched live USD/NGN rate: {rates['NGN']}")
                 self._rates = rates
                 self._rates_timestamp = datetime.now(timezone.utc)
+                if self.cache:
+                    self.cache.set(
+                        _FX_RATES_CACHE_KEY,
+                        {'rates': rates, 'fetched_at': self._rates_timestamp.timestamp()},
+                        ttl_hours=1,
+                    )
                 return self._rates
             else:
                 logger.warning(f"Exchange rate API returned status {response.status_code}, using fallback")
@@ -121,20 +170,11 @@ class CurrencyFormatter:
     @staticmethod
     def detect_currency(price_string: str) -> str:
         """Best-effort detection of currency code from a raw price string."""
-        s = (price_string or "").upper()
-        if "₦" in s or "NGN" in s:
+        matches = _CURRENCY_RE.findall(price_string or "")
+        if not matches:
             return "NGN"
-        if "$" in s or "USD" in s:
-            return "USD"
-        if "€" in s or "EUR" in s:
-            return "EUR"
-        if "£" in s or "GBP" in s:
-            return "GBP"
-        if "CAD" in s or "C$" in s:
-            return "CAD"
-        if "AUD" in s or "A$" in s:
-            return "AUD"
-        return "NGN"
+        marker = min((m.upper() for m in matches), key=_MARKER_RANK.__getitem__)
+        return _MARKER_CODE[marker]
 
     @staticmethod
     def parse_price_with_currency(price_string: str) -> Tuple[Optional[float], str]:
@@ -143,23 +183,12 @@ class CurrencyFormatter:
             return None, "NGN"
 
         currency = CurrencyFormatter.detect_currency(price_string)
-        try:
-            cleaned = price_string
-            for ch in ['₦', '$', '€', '£']:
-                cleaned = cleaned.replace(ch, '')
-            for code in ['NGN', 'USD', 'EUR', 'GBP', 'CAD', 'AUD']:
-                cleaned = cleaned.replace(code, '')
-            cleaned = cleaned.replace(',', '').strip()
-
-            if '-' in cleaned:
-                cleaned = cleaned.split('-')[0].strip()
-
-            match = re.search(r'[\d.]+', cleaned)
-            if match:
-                return float(match.group()), currency
-            return None, currency
-        except Exception:
-            return None, currency
+        cleaned = _CURRENCY_STRIP_RE.sub('', price_string).replace(',', '').strip()
+
+        if '-' in cleaned:
+            cleaned = cleaned.split('-')[0].strip()
+
+        return _first_number(cleaned), currency
     
     def format_price_range(self, min_price: float, max_price: float) -> str:
         """Format a price range in Naira"""
@@ -3,7 +3,15 @@ Gadget Category Detection Utility.
 Detects product category from name to enable category-specific analysis.
 """
 
-from typing import Optional
+import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import List, Mapping, Optional
+
+try:
+    import ahocorasick  # optional: pyahocorasick
+except ImportError:
+    ahocorasick = None
 
 # Gadget category keywords
 GADGET_CATEGORIES = {
@@ -46,6 +54,56 @@ GADGET_CATEGORIES = {
     ]
 }
 
+
+# Categories are checked in declaration order: the earliest-declared category
+# with any matching keyword wins, wherever that keyword appears in the name
+_CATEGORY_RANK = {category: rank for rank, category in enumerate(GADGET_CATEGORIES)}
+
+# Keyword -> category, in priority order (a keyword listed twice keeps the first)
+_KW_TO_CATEGORY = {}
+for _category, _keywords in GADGET_CATEGORIES.items():
+    for _keyword in _keywords:
+        _KW_TO_CATEGORY.setdefault(_keyword, _category)
+
+# Lookahead reports every (overlapping) keyword; at any one position the
+# alternation picks the highest-priority keyword starting there
+_CATEGORY_RE = re.compile("(?=(" + "|".join(map(re.escape, _KW_TO_CATEGORY)) + "))")
+
+
+def _build_category_automaton():
+    """One automaton over every category keyword, valued (priority, category)."""
+    automaton = ahocorasick.Automaton()
+    for keyword, category in _KW_TO_CATEGORY.items():
+        automaton.add_word(keyword, (_CATEGORY_RANK[category], category))
+    automaton.make_automaton()
+    return automaton
+
+
+_CATEGORY_AC = _build_category_automaton() if ahocorasick is not None else None
+
+
+def _scan_category(name_lower: str) -> Optional[str]:
+    """Highest-priority category with a keyword anywhere in ``name_lower``."""
+    if _CATEGORY_AC is not None:
+        best = None
+        for _, match in _CATEGORY_AC.iter(name_lower):
+            if best is None or match[0] < best[0]:
+                best = match
+                if best[0] == 0:
+                    break
+        return best[1] if best else None
+    
+    matches = _CATEGORY_RE.findall(name_lower)
+    if not matches:
+        return None
+    return min((_KW_TO_CATEGORY[kw] for kw in matches), key=_CATEGORY_RANK.__getitem__)
+
+
+# Names that are exactly one keyword resolve with a single dict probe. The
+# answer is precomputed with the full scan, since a keyword can contain a
+# higher-priority one ("galaxy tab" is a phone because of "galaxy")
+_EXACT_NAME_CATEGORY = {keyword: _scan_category(keyword) for keyword in _KW_TO_CATEGORY}
+
 # Critical features per category
 CATEGORY_FEATURES = {
     "phone": {
@@ -108,7 +166,15 @@ UNIVERSAL_FEATURES = {
     "quality": ["quality", "build", "material", "premium", "solid"]
 }
 
+# Universal + category features merged once; read-only since they are shared
+_MERGED_FEATURES = {
+    category: MappingProxyType({**UNIVERSAL_FEATURES, **features})
+    for category, features in CATEGORY_FEATURES.items()
+}
+_MERGED_FEATURES[None] = MappingProxyType(dict(UNIVERSAL_FEATURES))
+
 
+@lru_cache(maxsize=2048)
 def detect_gadget_category(product_name: str) -> Optional[str]:
     """
     Detect the gadget category from product name.
@@ -121,15 +187,13 @@ def detect_gadget_category(product_name: str) -> Optional[str]:
     """
     name_lower = product_name.lower()
     
-    for category, keywords in GADGET_CATEGORIES.items():
-        for keyword in keywords:
-            if keyword in name_lower:
-                return category
-    
-    return None
+    category = _EXACT_NAME_CATEGORY.get(name_lower)
+    if category is not None:
+        return category
+    return _scan_category(name_lower)
 
 
-def get_category_features(category: Optional[str]) -> dict:
+def get_category_features(category: Optional[str]) -> Mapping[str, List[str]]:
     """
     Get the critical features to analyze for a category.
     
@@ -137,48 +201,30 @@ def get_category_features(category: Optional[str]) -> dict:
         category: Product category (phone, laptop, etc.) or None
         
     Returns:
-        Dictionary of feature aspects and their keywords
+        Read-only mapping of feature aspects and their keywords
     """
-    features = UNIVERSAL_FEATURES.copy()
-    
-    if category and category in CATEGORY_FEATURES:
-        features.update(CATEGORY_FEATURES[category])
-    
-    return features
+    return _MERGED_FEATURES.get(category, _MERGED_FEATURES[None])
 
 
-def get_category_prompt_instructions(product_name: str) -> str:
-    """
-    Generate LLM prompt instructions for category-specific analysis.
-    
-    Args:
-        product_name: Name of the product
-        
-    Returns:
-        Instruction string for LLM prompt
-    """
-    category = detect_gadget_category(product_name)
-    
-    # Universal durability instruction
-    base_instruction = """
+# Universal durability instruction
+_BASE_PROMPT_INSTRUCTION = """
 DURABILITY ASSESSMENT (required for all products):
 - Check for mentions of build quality, lifespan, and repair frequency
 - Note warranty information if available
 - Flag durability concerns if reviews mention breakage or repairs
 """
-    
-    if category == "phone":
-        return base_instruction + """
+
+# Category-specific prompt instructions, assembled once at import
+_CATEGORY_PROMPTS = {
+    "phone": _BASE_PROMPT_INSTRUCTION + """
 CRITICAL PHONE FEATURES to analyze:
 - Battery: Capacity (mAh), charging speed, real-world battery life
 - Camera: Megapixels, lens count, photo/video quality, night mode
 - Performance: RAM, processor (Snapdragon/MediaTek/Exynos), speed
 - Display: Size, type (AMOLED/LCD), refresh rate (Hz), brightness
 - Storage: Capacity options, expandable storage
-"""
-    
-    elif category == "laptop":
-        return base_instruction + """
+""",
+    "laptop": _BASE_PROMPT_INSTRUCTION + """
 CRITICAL LAPTOP FEATURES to analyze:
 - Processor: Core count, generation (e.g., 12th Gen i7), speed (GHz)
 - RAM: Capacity, type (DDR4/DDR5), upgradability
@@ -187,54 +233,56 @@ CRITICAL LAPTOP FEATURES to analyze:
 - Battery: Real-world hours of use
 - Compatibility: OS support, ports (USB-C, HDMI, etc.)
 - Build: Weight, material, keyboard quality
-"""
-    
-    elif category == "tablet":
-        return base_instruction + """
+""",
+    "tablet": _BASE_PROMPT_INSTRUCTION + """
 CRITICAL TABLET FEATURES to analyze:
 - Display: Size, resolution, refresh rate
 - Performance: Chip, RAM
 - Battery: Capacity, usage time
 - Stylus support and functionality
 - Storage options
-"""
-    
-    elif category == "tv":
-        return base_instruction + """
+""",
+    "tv": _BASE_PROMPT_INSTRUCTION + """
 CRITICAL TV FEATURES to analyze:
 - Display: Resolution (4K/8K), panel type (OLED/QLED), HDR support
 - Size: Screen size in inches
 - Smart features: OS, apps, streaming support
 - Audio: Built-in speaker quality
-"""
-    
-    elif category == "headphones":
-        return base_instruction + """
+""",
+    "headphones": _BASE_PROMPT_INSTRUCTION + """
 CRITICAL HEADPHONE FEATURES to analyze:
 - Sound quality: Bass, treble, clarity
 - Noise cancellation: ANC capability
 - Battery: Playtime hours, case charging
 - Comfort: Fit, weight, ear cushions
 - Connectivity: Bluetooth version, multipoint
-"""
-    
-    elif category == "camera":
-        return base_instruction + """
+""",
+    "camera": _BASE_PROMPT_INSTRUCTION + """
 CRITICAL CAMERA FEATURES to analyze:
 - Sensor: Megapixels, sensor size
 - Video: Resolution, frame rates
 - Lens: Aperture, zoom capability
 - Autofocus: Speed, accuracy
-"""
-    
-    elif category == "smartwatch":
-        return base_instruction + """
+""",
+    "smartwatch": _BASE_PROMPT_INSTRUCTION + """
 CRITICAL SMARTWATCH FEATURES to analyze:
 - Battery: Days of use per charge
 - Health tracking: Heart rate, SpO2, sleep, fitness
 - Display: Type, always-on capability
 - Features: GPS, NFC, water resistance
-"""
+""",
+}
+
+
+def get_category_prompt_instructions(product_name: str) -> str:
+    """
+    Generate LLM prompt instructions for category-specific analysis.
     
-    else:
-        return base_instruction
+    Args:
+        product_name: Name of the product
+        
+    Returns:
+        Instruction string for LLM prompt
+    """
+    category = detect_gadget_category(product_name)
+    return _CATEGORY_PROMPTS.get(category, _BASE_PROMPT_INSTRUCTION)
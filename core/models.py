@@ -387,6 +387,10 @@ class VideoMoment(BaseModel):
     youtube_url: str
     description: str
 
+    class Config:
+        extra = "ignore"
+        frozen = True
+
 class VideoProof(BaseModel):
     moments: List[VideoMoment] = Field(default=[])
 
@@ -396,6 +400,10 @@ class AuthenticityCheck(BaseModel):
     expected_result: str
     warning_sign: str = ""
 
+    class Config:
+        extra = "ignore"
+        frozen = True
+
 class FakeSpotterReport(BaseModel):
     risk_level: str
     common_scams: List[str] = Field(default=[])
@@ -406,6 +414,10 @@ class ForumOpinion(BaseModel):
     sentiment: str
     key_takeaway: str
 
+    class Config:
+        extra = "ignore"
+        frozen = True
+
 class VoxPopuliReport(BaseModel):
     owner_verdict: str
     love_it_for: List[str] = Field(default=[])
@@ -421,6 +433,10 @@ class SmartSwapOption(BaseModel):
     reason_to_buy: str = ""
     reason_to_avoid: str = ""
 
+    class Config:
+        extra = "ignore"
+        frozen = True
+
 class SmartSwapReport(BaseModel):
     base_price: float
     recommendation: str
@@ -441,6 +457,10 @@ class DisasterScenario(BaseModel):
     repair_cost_estimate: str
     survivability_score: int
 
+    class Config:
+        extra = "ignore"
+        frozen = True
+
 class WhatIfReport(BaseModel):
     disaster_score: int
     scenarios: List[DisasterScenario] = Field(default=[])
@@ -6,12 +6,12 @@ import os
 import time
 import logging
 import requests
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Any
 from datetime import datetime, timezone
 from urllib.parse import quote_plus
 from bs4 import BeautifulSoup
 
-from core.config import AppConfig, Constants
+from core.config import AppConfig, Constants, Retailer
 from core.models import RetailerPrice, PriceComparison, RecommendedRetailer
 from core.cache import CacheManager
 from core.currency import CurrencyFormatter
@@ -175,10 +175,10 @@ class NigerianPriceService:
                 price = self._fetch_retailer_price(product_name, retailer_id, retailer_info)
                 if price:
                     prices.append(price)
-                    logger.info(f"Got price from {retailer_info['name']}: ₦{price.price_naira:,.0f}" if price.price_naira else f"Got price from {retailer_info['name']}: N/A")
+                    logger.info(f"Got price from {retailer_info.name}: ₦{price.price_naira:,.0f}" if price.price_naira else f"Got price from {retailer_info.name}: N/A")
                 time.sleep(self.config.request_delay)  # Be polite
             except Exception as e:
-                logger.warning(f"Failed to fetch price from {retailer_info['name']}: {e}")
+                logger.warning(f"Failed to fetch price from {retailer_info.name}: {e}")
                 continue
         
         # Fetch from RapidAPI (global sources) if enabled and key is available
@@ -254,9 +254,9 @@ class NigerianPriceService:
         
         for price_entry in valid_prices:
             retailer_id = price_entry.retailer_id
-            retailer_info = Constants.NIGERIAN_RETAILERS.get(retailer_id, {})
-            trust_score = retailer_info.get('trust_score', 3)  # Default to 3 if unknown
-            trust_note = retailer_info.get('trust_note', '')
+            retailer_info = Constants.NIGERIAN_RETAILERS.get(retailer_id)
+            trust_score = retailer_info.trust_score if retailer_info else 3  # Default to 3 if unknown
+            trust_note = retailer_info.trust_note if retailer_info else ''
             
             if price_range > 0:
                 normalized_price = 1 - ((price_entry.price_naira - min_price) / price_range)
@@ -282,21 +282,21 @@ class NigerianPriceService:
                     best_reason = f"Good balance of competitive pricing and retailer reliability"
         
         if best_retailer:
-            retailer_info = Constants.NIGERIAN_RETAILERS.get(best_retailer.retailer_id, {})
+            retailer_info = Constants.NIGERIAN_RETAILERS.get(best_retailer.retailer_id)
             return RecommendedRetailer(
                 retailer_name=best_retailer.retailer_name,
                 retailer_id=best_retailer.retailer_id,
                 price_naira=best_retailer.price_naira,
                 product_url=best_retailer.product_url,
-                trust_score=retailer_info.get('trust_score', 3),
-                trust_note=retailer_info.get('trust_note', ''),
+                trust_score=retailer_info.trust_score if retailer_info else 3,
+                trust_note=retailer_info.trust_note if retailer_info else '',
                 recommendation_reason=best_reason
             )
         
         return None
 
     def _fetch_retailer_price(self, product_name: str, retailer_id: str, 
-                             retailer_info: Dict) -> Optional[RetailerPrice]:
+                             retailer_info: Retailer) -> Optional[RetailerPrice]:
         """Fetch price from a single retailer"""
         try:
             if retailer_id == 'jumia':
@@ -324,9 +324,9 @@ class NigerianPriceService:
             logger.warning(f"Scraping {retailer_id} failed: {e}")
             return None
 
-    def _scrape_jumia(self, product_name: str, retailer_id: str, retailer_info: Dict) -> Optional[RetailerPrice]:
+    def _scrape_jumia(self, product_name: str, retailer_id: str, retailer_info: Retailer) -> Optional[RetailerPrice]:
         try:
-            search_url = f"{retailer_info['search_url']}{quote_plus(product_name)}"
+            search_url = f"{retailer_info.search_url}{quote_plus(product_name)}"
             response = self.session.get(search_url, timeout=self.config.request_timeout)
             response.raise_for_status()
             
@@ -351,11 +351,11 @@ class NigerianPriceService:
                 discount = ((original_price - price) / original_price) * 100
             
             link = product.find('a', class_='core')
-            product_url = retailer_info['base_url'] + link.get('href', '') if link else ''
+            product_url = retailer_info.base_url + link.get('href', '') if link else ''
             
             return RetailerPrice(
                 retailer_id=retailer_id,
-                retailer_name=retailer_info['name'],
+                retailer_name=retailer_info.name,
                 price_naira=price,
                 original_price=original_price,
                 discount_percent=discount,
@@ -367,9 +367,9 @@ class NigerianPriceService:
             logger.warning(f"Jumia scraping error: {e}")
             return None
     
-    def _scrape_konga(self, product_name: str, retailer_id: str, retailer_info: Dict) -> Optional[RetailerPrice]:
+    def _scrape_konga(self, product_name: str, retailer_id: str, retailer_info: Retailer) -> Optional[RetailerPrice]:
         try:
-            search_url = f"{retailer_info['search_url']}{quote_plus(product_name)}"
+            search_url = f"{retailer_info.search_url}{quote_plus(product_name)}"
             response = self.session.get(search_url, timeout=self.config.request_timeout)
             response.raise_for_status()
             
@@ -394,11 +394,11 @@ class NigerianPriceService:
             link = product.find('a', href=True)
             product_url = link.get('href', '') if link else ''
             if product_url and not product_url.startswith('http'):
-                product_url = retailer_info['base_url'] + product_url
+                product_url = retailer_info.base_url + product_url
             
             return RetailerPrice(
                 retailer_id=retailer_id,
-                retailer_name=retailer_info['name'],
+                retailer_name=retailer_info.name,
                 price_naira=price,
                 product_url=product_url,
                 in_stock=True,
@@ -408,9 +408,9 @@ class NigerianPriceService:
             logger.warning(f"Konga scraping error: {e}")
             return None
     
-    def _scrape_slot(self, product_name: str, retailer_id: str, retailer_info: Dict) -> Optional[RetailerPrice]:
+    def _scrape_slot(self, product_name: str, retailer_id: str, retailer_info: Retailer) -> Optional[RetailerPrice]:
         try:
-            search_url = f"{retailer_info['search_url']}{quote_plus(product_name)}&post_type=product"
+            search_url = f"{retailer_info.search_url}{quote_plus(product_name)}&post_type=product"
             response = self.session.get(search_url, timeout=self.config.request_timeout)
             response.raise_for_status()
             
@@ -431,7 +431,7 @@ class NigerianPriceService:
             
             return RetailerPrice(
                 retailer_id=retailer_id,
-                retailer_name=retailer_info['name'],
+                retailer_name=retailer_info.name,
                 price_naira=price,
                 product_url=product_url,
                 in_stock=True,
@@ -441,9 +441,9 @@ class NigerianPriceService:
             logger.warning(f"Slot scraping error: {e}")
             return None
     
-    def _scrape_pointek(self, product_name: str, retailer_id: str, retailer_info: Dict) -> Optional[RetailerPrice]:
+    def _scrape_pointek(self, product_name: str, retailer_id: str, retailer_info: Retailer) -> Optional[RetailerPrice]:
         try:
-            search_url = f"{retailer_info['search_url']}{quote_plus(product_name)}&post_type=product"
+            search_url = f"{retailer_info.search_url}{quote_plus(product_name)}&post_type=product"
             response = self.session.get(search_url, timeout=self.config.request_timeout)
             response.raise_for_status()
             
@@ -466,7 +466,7 @@ class NigerianPriceService:
             
             return RetailerPrice(
                 retailer_id=retailer_id,
-                retailer_name=retailer_info['name'],
+                retailer_name=retailer_info.name,
                 price_naira=price,
                 product_url=product_url,
                 in_stock=True,
@@ -476,9 +476,9 @@ class NigerianPriceService:
             logger.warning(f"Pointek scraping error: {e}")
             return None
     
-    def _scrape_jiji(self, product_name: str, retailer_id: str, retailer_info: Dict) -> Optional[RetailerPrice]:
+    def _scrape_jiji(self, product_name: str, retailer_id: str, retailer_info: Retailer) -> Optional[RetailerPrice]:
         try:
-            search_url = f"{retailer_info['search_url']}{quote_plus(product_name)}"
+            search_url = f"{retailer_info.search_url}{quote_plus(product_name)}"
             response = self.session.get(search_url, timeout=self.config.request_timeout)
             response.raise_for_status()
             
@@ -501,11 +501,11 @@ class NigerianPriceService:
             link = product.find('a', href=True)
             product_url = link.get('href', '') if link else ''
             if product_url and not product_url.startswith('http'):
-                product_url = retailer_info['base_url'] + product_url
+                product_url = retailer_info.base_url + product_url
             
             return RetailerPrice(
                 retailer_id=retailer_id,
-                retailer_name=retailer_info['name'],
+                retailer_name=retailer_info.name,
                 price_naira=price,
                 product_url=product_url,
                 in_stock=True,
@@ -515,9 +515,9 @@ class NigerianPriceService:
             logger.warning(f"Jiji scraping error: {e}")
             return None
     
-    def _scrape_kilimall(self, product_name: str, retailer_id: str, retailer_info: Dict) -> Optional[RetailerPrice]:
+    def _scrape_kilimall(self, product_name: str, retailer_id: str, retailer_info: Retailer) -> Optional[RetailerPrice]:
         try:
-            search_url = f"{retailer_info['search_url']}{quote_plus(product_name)}"
+            search_url = f"{retailer_info.search_url}{quote_plus(product_name)}"
             response = self.session.get(search_url, timeout=self.config.request_timeout)
             response.raise_for_status()
             
@@ -538,11 +538,11 @@ class NigerianPriceService:
             link = product.find('a', href=True)
             product_url = link.get('href', '') if link else ''
             if product_url and not product_url.startswith('http'):
-                product_url = retailer_info['base_url'] + product_url
+                product_url = retailer_info.base_url + product_url
             
             return RetailerPrice(
                 retailer_id=retailer_id,
-                retailer_name=retailer_info['name'],
+                retailer_name=retailer_info.name,
                 price_naira=price,
                 product_url=product_url,
                 in_stock=True,
@@ -552,9 +552,9 @@ class NigerianPriceService:
             logger.warning(f"Kilimall scraping error: {e}")
             return None
     
-    def _scrape_kara(self, product_name: str, retailer_id: str, retailer_info: Dict) -> Optional[RetailerPrice]:
+    def _scrape_kara(self, product_name: str, retailer_id: str, retailer_info: Retailer) -> Optional[RetailerPrice]:
         try:
-            search_url = f"{retailer_info['search_url']}{quote_plus(product_name)}&post_type=product"
+            search_url = f"{retailer_info.search_url}{quote_plus(product_name)}&post_type=product"
             response = self.session.get(search_url, timeout=self.config.request_timeout)
             response.raise_for_status()
             
@@ -575,7 +575,7 @@ class NigerianPriceService:
             
             return RetailerPrice(
                 retailer_id=retailer_id,
-                retailer_name=retailer_info['name'],
+                retailer_name=retailer_info.name,
                 price_naira=price,
                 product_url=product_url,
                 in_stock=True,
@@ -585,9 +585,9 @@ class NigerianPriceService:
             logger.warning(f"Kara scraping error: {e}")
             return None
     
-    def _scrape_3chub(self, product_name: str, retailer_id: str, retailer_info: Dict) -> Optional[RetailerPrice]:
+    def _scrape_3chub(self, product_name: str, retailer_id: str, retailer_info: Retailer) -> Optional[RetailerPrice]:
         try:
-            search_url = f"{retailer_info['search_url']}{quote_plus(product_name)}&post_type=product"
+            search_url = f"{retailer_info.search_url}{quote_plus(product_name)}&post_type=product"
             response = self.session.get(search_url, timeout=self.config.request_timeout)
             response.raise_for_status()
             
@@ -608,7 +608,7 @@ class NigerianPriceService:
             
             return RetailerPrice(
                 retailer_id=retailer_id,
-                retailer_name=retailer_info['name'],
+                retailer_name=retailer_info.name,
                 price_naira=price,
                 product_url=product_url,
                 in_stock=True,
@@ -618,9 +618,9 @@ class NigerianPriceService:
             logger.warning(f"3C Hub scraping error: {e}")
             return None
     
-    def _scrape_fouani(self, product_name: str, retailer_id: str, retailer_info: Dict) -> Optional[RetailerPrice]:
+    def _scrape_fouani(self, product_name: str, retailer_id: str, retailer_info: Retailer) -> Optional[RetailerPrice]:
         try:
-            search_url = f"{retailer_info['search_url']}{quote_plus(product_name)}&post_type=product"
+            search_url = f"{retailer_info.search_url}{quote_plus(product_name)}&post_type=product"
             response = self.session.get(search_url, timeout=self.config.request_timeout)
             response.raise_for_status()
             
@@ -641,7 +641,7 @@ class NigerianPriceService:
             
             return RetailerPrice(
                 retailer_id=retailer_id,
-                retailer_name=retailer_info['name'],
+                retailer_name=retailer_info.name,
                 price_naira=price,
                 product_url=product_url,
                 in_stock=True,
@@ -651,9 +651,9 @@ class NigerianPriceService:
             logger.warning(f"Fouani scraping error: {e}")
             return None
     
-    def _scrape_woocommerce_generic(self, product_name: str, retailer_id: str, retailer_info: Dict) -> Optional[RetailerPrice]:
+    def _scrape_woocommerce_generic(self, product_name: str, retailer_id: str, retailer_info: Retailer) -> Optional[RetailerPrice]:
         try:
-            search_url = f"{retailer_info['search_url']}{quote_plus(product_name)}&post_type=product"
+            search_url = f"{retailer_info.search_url}{quote_plus(product_name)}&post_type=product"
             response = self.session.get(search_url, timeout=self.config.request_timeout)
             response.raise_for_status()
             
@@ -687,16 +687,16 @@ class NigerianPriceService:
             link = product.find('a', href=True)
             product_url = link.get('href', '') if link else ''
             if product_url and not product_url.startswith('http'):
-                product_url = retailer_info['base_url'] + product_url
+                product_url = retailer_info.base_url + product_url
             
             return RetailerPrice(
                 retailer_id=retailer_id,
-                retailer_name=retailer_info['name'],
+                retailer_name=retailer_info.name,
                 price_naira=price,
                 product_url=product_url,
                 in_stock=True,
                 last_checked=datetime.now(timezone.utc)
             )
         except Exception as e:
-            logger.warning(f"{retailer_info['name']} scraping error: {e}")
+            logger.warning(f"{retailer_info.name} scraping error: {e}")
             return None
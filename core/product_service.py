@@ -4,13 +4,12 @@ Main product review service orchestration.
 
 import logging
 from typing import List, Optional, cast
-from groq import Groq
 
 from core.config import AppConfig
 from core.models import (
     ProductReview, EnhancedProductReview, ProductComparison, UserProfile
 )
-from core.cache import CacheManager
+from core.cache import get_shared_cache_manager
 from core.scraping import (
     WebSearchClient, ContentScraper, ProductImageFetcher, SearchError
 )
@@ -23,7 +22,8 @@ from core.review_generator import (
 from core.analyzers import (
     RedFlagDetector, PurchaseTimingAdvisor, ResaleAnalyzer,
     VideoProofFinder, FakeSpotter, VoxPopuliAnalyzer,
-    SmartSwapAnalyzer, NetPriceAnalyzer, DisasterAnalyzer
+    SmartSwapAnalyzer, NetPriceAnalyzer, DisasterAnalyzer, UnifiedAnalyzer,
+    get_shared_groq_client
 )
 
 logger = logging.getLogger(__name__)
@@ -39,8 +39,8 @@ class ProductReviewService:
     
     def __init__(self, groq_api_key: str, config: AppConfig = None):
         self.config = config or AppConfig()
-        self.groq_client = Groq(api_key=groq_api_key)
-        self.cache_manager = CacheManager(self.config)
+        self.groq_client = get_shared_groq_client(groq_api_key)
+        self.cache_manager = get_shared_cache_manager(self.config)
         
         # Initialize components
         self.search_client = WebSearchClient(self.cache_manager, self.config)
@@ -103,13 +103,23 @@ class EnhancedProductReviewService(ProductReviewService):
         # Initialize intelligence services
         self.red_flag_detector = RedFlagDetector(self.groq_client, self.config)
         self.timing_advisor = PurchaseTimingAdvisor(self.groq_client, self.config)
-        self.resale_analyzer = ResaleAnalyzer(self.groq_client, self.config)
-        self.video_proof_finder = VideoProofFinder(self.groq_client, self.config)
-        self.fake_spotter = FakeSpotter(self.groq_client, self.config)
-        self.vox_populi = VoxPopuliAnalyzer(self.groq_client, self.config)
-        self.smart_swap_analyzer = SmartSwapAnalyzer(self.groq_client, self.config)
-        self.net_price_analyzer = NetPriceAnalyzer(self.groq_client, self.config)
-        self.disaster_analyzer = DisasterAnalyzer(self.groq_client, self.config)
+        self.resale_analyzer = ResaleAnalyzer(self.groq_client, self.config, self.cache_manager)
+        self.video_proof_finder = VideoProofFinder(self.groq_client, self.config, self.cache_manager)
+        self.fake_spotter = FakeSpotter(self.groq_client, self.config, self.cache_manager)
+        self.vox_populi = VoxPopuliAnalyzer(self.groq_client, self.config, self.cache_manager)
+        self.smart_swap_analyzer = SmartSwapAnalyzer(self.groq_client, self.config, self.cache_manager)
+        self.net_price_analyzer = NetPriceAnalyzer(self.groq_client, self.config, self.cache_manager)
+        self.disaster_analyzer = DisasterAnalyzer(self.groq_client, self.config, self.cache_manager)
+        self.unified_analyzer = UnifiedAnalyzer(
+            self.groq_client,
+            self.config,
+            self.resale_analyzer,
+            self.video_proof_finder,
+            self.fake_spotter,
+            self.vox_populi,
+            self.disaster_analyzer,
+            cache_manager=self.cache_manager
+        )
         
         # Initialize comparison generator
         self.comparison_generator = ComparisonGenerator(self.groq_client, self.config)
@@ -129,7 +139,8 @@ class EnhancedProductReviewService(ProductReviewService):
             self.vox_populi,
             self.smart_swap_analyzer,
             self.net_price_analyzer,
-            self.disaster_analyzer
+            self.disaster_analyzer,
+            self.unified_analyzer
         )
     
     def generate_review(self, product_name: str, use_web_search: bool = True, mode: str = None) -> EnhancedProductReview:
@@ -7,6 +7,7 @@ import logging
 from typing import List, Optional, Dict, Any, Tuple
 from datetime import datetime, timezone
 from collections import Counter
+from functools import partial
 from pydantic import ValidationError as PydanticValidationError
 from groq import Groq
 
@@ -23,8 +24,8 @@ from core.price_service import NigerianPriceService
 from core.analyzers import (
     RedFlagDetector, PurchaseTimingAdvisor, ResaleAnalyzer,
     VideoProofFinder, FakeSpotter, VoxPopuliAnalyzer,
-    SmartSwapAnalyzer, NetPriceAnalyzer, DisasterAnalyzer,
-    PurchaseTimingAdvice, RedFlagReport
+    SmartSwapAnalyzer, NetPriceAnalyzer, DisasterAnalyzer, UnifiedAnalyzer,
+    PurchaseTimingAdvice, RedFlagReport, build_analysis_context, run_all_analyzers
 )
 
 logger = logging.getLogger(__name__)
@@ -544,7 +545,8 @@ class EnhancedReviewGenerator(ReviewGenerator):
                  vox_analyzer: Optional[VoxPopuliAnalyzer] = None,
                  smart_swap_analyzer: Optional[SmartSwapAnalyzer] = None,
                  net_price_analyzer: Optional[NetPriceAnalyzer] = None,
-                 disaster_analyzer: Optional[DisasterAnalyzer] = None):
+                 disaster_analyzer: Optional[DisasterAnalyzer] = None,
+                 unified_analyzer: Optional[UnifiedAnalyzer] = None):
         super().__init__(groq_client, config)
         self.sentiment_analyzer = sentiment_analyzer
         self.image_fetcher = image_fetcher
@@ -558,6 +560,7 @@ class EnhancedReviewGenerator(ReviewGenerator):
         self.smart_swap_analyzer = smart_swap_analyzer
         self.net_price_analyzer = net_price_analyzer
         self.disaster_analyzer = disaster_analyzer
+        self.unified_analyzer = unified_analyzer
     
     def generate_enhanced_review(self, product_name: str, search_results: List[SearchResult],
                                 scraped_content: List[ScrapedContent]) -> EnhancedProductReview:
@@ -688,57 +691,53 @@ class EnhancedReviewGenerator(ReviewGenerator):
         )
         
         # === Compose additional intelligence outputs ===
-        all_content_text = " ".join([c.content for c in scraped_content if c and c.content])
-
-        resale_analysis = None
-        video_proof = None
-        fake_spotter_report = None
-        vox_populi_report = None
-        smart_swap_report = None
-        net_price_report = None
-        what_if_report = None
-
-        try:
+        # One shared, already-truncated context for every analyzer that reads scraped text
+        all_content_text = build_analysis_context(c.content for c in scraped_content if c)
+
+        # Each analyzer is an independent Groq round-trip; run them side by side
+        jobs = {}
+        use_unified = self.unified_analyzer is not None and getattr(self.config, 'enable_unified_analysis', False)
+        if use_unified:
+            jobs["Unified analyzer"] = partial(
+                self.unified_analyzer.analyze_all, product_name, price_naira,
+                base_review.specifications_inferred, all_content_text, base_review.pros, base_review.cons
+            )
+        else:
             if self.resale_analyzer:
-                resale_analysis = self.resale_analyzer.analyze_resale_value(product_name, price_naira)
-        except Exception as e:
-            logger.warning(f"Resale analyzer failed: {e}")
-
-        try:
+                jobs["Resale analyzer"] = partial(self.resale_analyzer.analyze_resale_value, product_name, price_naira)
             if self.video_finder:
-                video_proof = self.video_finder.find_video_proofs(product_name, base_review.pros, base_review.cons)
-        except Exception as e:
-            logger.warning(f"Video proof finder failed: {e}")
-
-        try:
+                jobs["Video proof finder"] = partial(
+                    self.video_finder.find_video_proofs, product_name, base_review.pros, base_review.cons
+                )
             if self.fake_spotter:
-                fake_spotter_report = self.fake_spotter.analyze_authenticity(product_name, all_content_text)
-        except Exception as e:
-            logger.warning(f"Fake spotter failed: {e}")
-
-        try:
+                jobs["Fake spotter"] = partial(self.fake_spotter.analyze_authenticity, product_name, all_content_text)
             if self.vox_analyzer:
-                vox_populi_report = self.vox_analyzer.analyze_owner_sentiment(product_name, all_content_text)
-        except Exception as e:
-            logger.warning(f"Vox Populi analyzer failed: {e}")
-
-        try:
-            if self.smart_swap_analyzer:
-                smart_swap_report = self.smart_swap_analyzer.analyze_swap_options(product_name, price_naira or 0)
-        except Exception as e:
-            logger.warning(f"Smart swap analyzer failed: {e}")
-
-        try:
-            if self.net_price_analyzer:
-                net_price_report = self.net_price_analyzer.calculate_net_price(product_name, price_naira or 0)
-        except Exception as e:
-            logger.warning(f"Net price analyzer failed: {e}")
-
-        try:
+                jobs["Vox Populi analyzer"] = partial(self.vox_analyzer.analyze_owner_sentiment, product_name, all_content_text)
             if self.disaster_analyzer:
-                what_if_report = self.disaster_analyzer.simulate_disasters(product_name, base_review.specifications_inferred)
-        except Exception as e:
-            logger.warning(f"Disaster analyzer failed: {e}")
+                jobs["Disaster analyzer"] = partial(
+                    self.disaster_analyzer.simulate_disasters, product_name, base_review.specifications_inferred
+                )
+        if self.smart_swap_analyzer:
+            jobs["Smart swap analyzer"] = partial(self.smart_swap_analyzer.analyze_swap_options, product_name, price_naira or 0)
+        if self.net_price_analyzer:
+            jobs["Net price analyzer"] = partial(self.net_price_analyzer.calculate_net_price, product_name, price_naira or 0)
+
+        results = run_all_analyzers(jobs)
+        if use_unified:
+            sections = results.get("Unified analyzer") or {}
+            resale_analysis = sections.get("resale")
+            video_proof = sections.get("video_proof")
+            fake_spotter_report = sections.get("fake_spotter")
+            vox_populi_report = sections.get("vox_populi")
+            what_if_report = sections.get("disaster")
+        else:
+            resale_analysis = results.get("Resale analyzer")
+            video_proof = results.get("Video proof finder")
+            fake_spotter_report = results.get("Fake spotter")
+            vox_populi_report = results.get("Vox Populi analyzer")
+            what_if_report = results.get("Disaster analyzer")
+        smart_swap_report = results.get("Smart swap analyzer")
+        net_price_report = results.get("Net price analyzer")
 
         # Create enhanced review
         enhanced_review = EnhancedProductReview(
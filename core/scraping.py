@@ -539,7 +539,7 @@ class ProductImageFetcher:
             if len(images) >= max_images:
                 break
             try:
-                search_url = retailer_info['search_url'] + quote_plus(product_name)
+                search_url = retailer_info.search_url + quote_plus(product_name)
                 resp = self.session.get(search_url, timeout=10)
                 resp.raise_for_status()
                 soup = BeautifulSoup(resp.text, 'html.parser')
@@ -552,10 +552,10 @@ class ProductImageFetcher:
                         if img_url.startswith('//'):
                             img_url = 'https:' + img_url
                         elif img_url.startswith('/'):
-                            img_url = retailer_info['base_url'] + img_url
+                            img_url = retailer_info.base_url + img_url
                         alt = img.get('alt', product_name)
                         if self._is_valid_image_url(img_url) and self._is_product_image(img_url, alt, product_name):
-                            images.append(ProductImage(url=img_url, thumbnail_url=img_url, source=retailer_info['name'], alt_text=alt))
+                            images.append(ProductImage(url=img_url, thumbnail_url=img_url, source=retailer_info.name, alt_text=alt))
                             if len(images) >= max_images:
                                 break
                     if len(images) >= max_images:
@@ -4,20 +4,33 @@ Sentiment analysis and NLU services.
 
 import re
 import logging
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
-from textblob import TextBlob
-from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 
 from core.models import ProductReview, SentimentScore
 
 logger = logging.getLogger(__name__)
 
+
+# TextBlob and VADER are slow to import (and VADER loads its lexicon from disk
+# on construction), so both are loaded on first use and shared process-wide.
+@lru_cache(maxsize=1)
+def get_vader_analyzer():
+    """Return the shared VADER SentimentIntensityAnalyzer."""
+    from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
+    return SentimentIntensityAnalyzer()
+
+
+@lru_cache(maxsize=1)
+def _textblob_class():
+    from textblob import TextBlob
+    return TextBlob
+
+
 class SentimentAnalyzer:
     """Sophisticated sentiment analysis for product reviews"""
     
     def __init__(self):
-        self.vader = SentimentIntensityAnalyzer()
-        
         # Product-specific sentiment lexicon enhancements
         self.positive_terms = {
             'excellent', 'amazing', 'outstanding', 'superb', 'fantastic',
@@ -43,6 +56,10 @@ class SentimentAnalyzer:
             'usability': ['easy', 'difficult', 'intuitive', 'complicated', 'user-friendly']
         }
     
+    @property
+    def vader(self):
+        return get_vader_analyzer()
+    
     def analyze_review(self, review: ProductReview) -> SentimentScore:
         """Perform comprehensive sentiment analysis on product review"""
         
@@ -50,7 +67,7 @@ class SentimentAnalyzer:
         full_text = self._build_full_text(review)
         
         # TextBlob analysis
-        blob = TextBlob(full_text)
+        blob = _textblob_class()(full_text)
         polarity = blob.sentiment.polarity
         subjectivity = blob.sentiment.subjectivity
         
@@ -669,8 +669,8 @@ class EnhancedStreamlitUI(StreamlitUI):
             num_cols = min(len(sorted_prices), 4)
             cols = st.columns(num_cols)
             for idx, price in enumerate(sorted_prices[:4]):
-                retailer_info = Constants.NIGERIAN_RETAILERS.get(price.retailer_id, {})
-                logo = retailer_info.get('logo', '🛒')
+                retailer_info = Constants.NIGERIAN_RETAILERS.get(price.retailer_id)
+                logo = retailer_info.logo if retailer_info else '🛒'
                 with cols[idx % num_cols]:
                     is_best = idx == 0
                     border_color = "#4CAF50" if is_best else "#ddd"
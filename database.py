@@ -1,5 +1,5 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 
 from db_models import Base
@@ -24,7 +24,6 @@ def init_db() -> None:
     # Lightweight migrations (SQLite only)
     # WARNING: This is a simplified approach. For production, use Alembic or similar.
     try:
-        from sqlalchemy import inspect, text
         import logging
         logger = logging.getLogger(__name__)
 
@@ -32,22 +31,29 @@ def init_db() -> None:
         if not DATABASE_URL.startswith("sqlite"):
             return
 
-        insp = inspect(engine)
-        if "users" in insp.get_table_names():
-            cols = {c["name"] for c in insp.get_columns("users")}
-            if "password_hash" not in cols:
-                logger.info("Migrating users table: adding password_hash column")
-                with engine.begin() as conn:
-                    # SQLite-specific ALTER TABLE - using text() for DDL statement
-                    # Note: column name is hardcoded (not user input) so no SQL injection risk
-                    conn.execute(text("ALTER TABLE users ADD COLUMN password_hash VARCHAR(255)"))
-                logger.info("Migration completed successfully")
+        # One PRAGMA round-trip instead of Inspector reflection; it returns
+        # no rows when the table does not exist.
+        with engine.connect() as conn:
+            cols = {row[1] for row in conn.execute(text("PRAGMA table_info(users)"))}
+        if cols and "password_hash" not in cols:
+            logger.info("Migrating users table: adding password_hash column")
+            with engine.begin() as conn:
+                # SQLite-specific ALTER TABLE - using text() for DDL statement
+                # Note: column name is hardcoded (not user input) so no SQL injection risk
+                conn.execute(text("ALTER TABLE users ADD COLUMN password_hash VARCHAR(255)"))
+            logger.info("Migration completed successfully")
     except Exception as e:
         # Non-fatal: DB might be already migrated or migration not needed
         import logging
         logging.getLogger(__name__).warning(f"Database migration skipped or failed: {e}")
 
 
+def ping_db() -> None:
+    """Check out a pooled connection and run a trivial query against it."""
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+
+
 def get_db():
     db = SessionLocal()
     try:
@@ -1,5 +1,7 @@
 """Authentication routes for the Product Review Engine API."""
 
+import asyncio
+
 from fastapi import APIRouter, HTTPException, Depends
 from pydantic import BaseModel, EmailStr
 from sqlalchemy.orm import Session
@@ -39,7 +41,8 @@ def create_user(db: Session, email: str, password: str) -> User:
 
 @router.post("/register")
 async def register(req: AuthRegisterRequest, db: Session = Depends(get_db)):
-    user = create_user(db, req.email, req.password)
+    # bcrypt is deliberately slow; hash in a worker thread to keep the event loop free
+    user = await asyncio.to_thread(create_user, db, req.email, req.password)
     token = create_access_token(user_id=user.id)
     return {
         "access_token": token,
@@ -53,7 +56,7 @@ async def login(req: AuthLoginRequest, db: Session = Depends(get_db)):
     user = get_user_by_email(db, req.email)
     if not user or not user.password_hash:
         raise HTTPException(status_code=401, detail="Invalid email or password")
-    if not verify_password(req.password, user.password_hash):
+    if not await asyncio.to_thread(verify_password, req.password, user.password_hash):
         raise HTTPException(status_code=401, detail="Invalid email or password")
 
     token = create_access_token(user_id=user.id)
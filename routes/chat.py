@@ -1,5 +1,6 @@
 """Chat routes for the Product Review Engine API."""
 
+import asyncio
 import logging
 import re
 from typing import Optional, Dict, Any, List
@@ -87,7 +88,9 @@ async def chat(
         product_name = req.validated_product_name
         message = req.validated_message
         
-        review = service.generate_review(product_name, use_web_search=req.use_web, mode=req.data_mode)
+        review = await asyncio.to_thread(
+            service.generate_review, product_name, use_web_search=req.use_web, mode=req.data_mode
+        )
 
         profile_obj = None
         if req.user_profile:
@@ -96,7 +99,8 @@ async def chat(
             except Exception:
                 profile_obj = None
 
-        reply = service.chat_service.get_chat_response(
+        reply = await asyncio.to_thread(
+            service.chat_service.get_chat_response,
             user_message=message,
             conversation_history=req.conversation_history,
             product_review=review,
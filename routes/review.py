@@ -1,5 +1,6 @@
 """Review and comparison routes for the Product Review Engine API."""
 
+import asyncio
 import logging
 import re
 from typing import Optional, Dict, Any
@@ -72,7 +73,9 @@ async def generate_review(
     service = get_review_service()
     try:
         product_name = req.validated_product_name
-        review = service.generate_review(product_name, use_web_search=req.use_web, mode=req.data_mode)
+        review = await asyncio.to_thread(
+            service.generate_review, product_name, use_web_search=req.use_web, mode=req.data_mode
+        )
 
         if current_user:
             if hasattr(review, "model_dump"):
@@ -100,7 +103,7 @@ async def compare_products(req: CompareRequest):
     """Generate a side-by-side comparison between up to 3 products."""
     service = get_review_service()
     try:
-        comparison = service.generate_comparison(req.products)
+        comparison = await asyncio.to_thread(service.generate_comparison, req.products)
         return comparison
     except ProductReviewError as e:
         logger.warning(f"Product review error in compare: {e}")
@@ -0,0 +1,24 @@
+import pytest
+
+pytest.importorskip("groq")
+pytest.importorskip("pydantic")
+
+from core.analyzers import _KEYWORD_RE, _KEYWORD_CATEGORIES
+
+
+def _found(text):
+    return {match.group(1) for match in _KEYWORD_RE.finditer(text.lower())}
+
+
+def test_doa_is_not_matched_inside_words():
+    assert "doa" not in _found("Setting it up was totally doable in ten minutes.")
+
+
+def test_doa_matches_as_a_whole_word():
+    found = _found("Mine was DOA, so I sent it back.")
+    assert "doa" in found
+    assert _KEYWORD_CATEGORIES["doa"] == "defect"
+
+
+def test_phrases_still_match_as_substrings():
+    assert {"stopped working", "returned"} <= _found("It stopped working and I returned it.")